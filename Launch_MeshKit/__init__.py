@@ -9,7 +9,7 @@ from . import point_array
 from . import radial_offset
 from . import segment_mesh
 from . import edit_attribute
-from .vertex_quantize import MeshKit_Vertex_Quantize, MeshKit_UV_Quantize, MESHKIT_PT_vertex_quantize, MESHKIT_PT_uv_quantize
+from .vertex_quantize import MeshKit_Vertex_Quantize, MeshKit_Vertex_Quantize_Modal, MeshKit_UV_Quantize, MESHKIT_PT_vertex_quantize, MESHKIT_PT_uv_quantize
 
 
 
@@ -404,11 +404,36 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 			('+', '+', 'Align object with positive Z')
 			],
 		default='Z')
+	mesh_align_bounds: bpy.props.EnumProperty(
+		name='Bounds',
+		description='Geometry used to measure the alignment bounds',
+		items=[
+			('BOX', 'Bounding Box', 'Use the object bounding box (fast, includes modifiers, may be out of date after direct data edits)'),
+			('VERTS', 'Vertices', 'Use the exact bounds of all mesh vertices'),
+			('SELECTED', 'Selected Vertices', 'Use the exact bounds of the selected mesh vertices'),
+			('EVALUATED', 'Evaluated Mesh', 'Use the exact bounds of the mesh after modifiers')
+			],
+		default='BOX')
+	mesh_align_selected: bpy.props.BoolProperty(
+		name="All Selected Objects",
+		description="Align every selected mesh object, translating shared mesh data only once",
+		default=False)
 	
 	
 	
 	########## Planar UV ##########
 	
+	projection_mode: bpy.props.EnumProperty(
+		name='Mode',
+		description='Projection shape',
+		items=[
+			('PLANAR', 'Planar', 'Flat projection along a single axis'),
+			('BOX', 'Box', 'Planar projection along the dominant axis of each face normal (triplanar)'),
+			('CYLINDER', 'Cylindrical', 'Wrap around the projection axis, using the height along the axis for V'),
+			('SPHERE', 'Spherical', 'Wrap around the projection axis, using latitude for V')
+			],
+		default='PLANAR',
+		update=planar_uv.meshkit_planar_uv_live_update)
 	projection_axis: bpy.props.EnumProperty(
 		name='Axis',
 		description='Planar projection axis',
@@ -417,21 +442,24 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 			('Y', 'Y', 'Y axis projection'),
 			('Z', 'Z', 'Z axis projection')
 			],
-		default='X')
+		default='X',
+		update=planar_uv.meshkit_planar_uv_live_update)
 	projection_centre: bpy.props.FloatVectorProperty(
 		name="Centre",
 		description="Centre of the planar projection mapping area",
 		subtype="TRANSLATION",
 		default=[0.0, 0.0, 0.0],
 		step=1.25,
-		precision=3)
+		precision=3,
+		update=planar_uv.meshkit_planar_uv_live_update)
 	projection_size: bpy.props.FloatVectorProperty(
 		name="Size",
 		description="Size of the planar projection mapping area",
 		subtype="TRANSLATION",
 		default=[1.0, 1.0, 1.0],
 		step=1.25,
-		precision=3)
+		precision=3,
+		update=planar_uv.meshkit_planar_uv_live_update)
 	projection_space: bpy.props.EnumProperty(
 		name='Space',
 		description='Planar projection coordinate space',
@@ -439,7 +467,8 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 			('L', 'Local', 'Projection using local space'),
 			('W', 'World', 'Projection using world space')
 			],
-		default='L')
+		default='L',
+		update=planar_uv.meshkit_planar_uv_live_update)
 	projection_rotation: bpy.props.EnumProperty(
 		name='Rotation',
 		description='Planar projection axis',
@@ -449,7 +478,8 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 			('-XY', '180', '-XY orientation projection'),
 			('-YX', '270', '-YX orientation projection')
 			],
-		default='+XY')
+		default='+XY',
+		update=planar_uv.meshkit_planar_uv_live_update)
 	projection_flip: bpy.props.EnumProperty(
 		name='Flip',
 		description='Planar projection axis',
@@ -457,7 +487,8 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 			('1.0', 'Front', 'Projection from positive direction'),
 			('-1.0', 'Back', 'Projection from negative direction')
 			],
-		default='1.0')
+		default='1.0',
+		update=planar_uv.meshkit_planar_uv_live_update)
 	projection_align: bpy.props.EnumProperty(
 		name='Alignment',
 		description='UV map alignment',
@@ -465,7 +496,21 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 			('0.5', 'Image', 'Align mapped geometry centre to UV 0.5, 0.5'),
 			('0.0', 'Zero', 'Align mapped geometry centre to UV 0.0, 0.0')
 			],
-		default='0.5')
+		default='0.5',
+		update=planar_uv.meshkit_planar_uv_live_update)
+	projection_selected: bpy.props.BoolProperty(
+		name="All Selected Objects",
+		description="Project every selected mesh object, use world space for a continuous mapping across objects",
+		default=False)
+	projection_live: bpy.props.BoolProperty(
+		name="Live Preview",
+		description="Update the UV map of the selected faces as the projection settings change, caching the selected loops when enabled",
+		default=False,
+		update=planar_uv.meshkit_planar_uv_live_toggle)
+	projection_density: bpy.props.BoolProperty(
+		name="Texel Density",
+		description="Store the world space texel density (square root of UV area over 3D area) of each projected face in a \"texel_density\" face attribute and report the min, median, and max",
+		default=False)
 	
 	
 	
@@ -478,6 +523,7 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 			('GRID', 'Cubic Grid', 'Cubic array of points'),
 			('GOLDEN', 'Golden Angle', 'Spherical area, will be disabled if any of the dimensions are smaller than the maximum point size'),
 			('PACK', 'Poisson Disc', 'Generates random points while deleting any that overlap'),
+			('BRIDSON', 'Poisson Disc (Bridson)', 'Fills the area to maximum density by growing new points around the boundary of existing ones'),
 			(None),
 			('DATA', 'Position Data (CSV/NPY)', 'Generates points from external files (CSV or NPY format) or internal text datablocks (CSV only)'),
 			('FIELD', 'Volume Field (Unity 3D)', 'Generates points from an external VF format file')
@@ -513,10 +559,28 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 		name="Random Rotation",
 		description="Rotate each generated point randomly",
 		default=False)
+	seed: bpy.props.IntProperty(
+		name="Seed",
+		description="Random seed for point positions, scales, and rotations, the same seed always recreates the same layout",
+		default=0,
+		min=0)
 	polyline: bpy.props.BoolProperty(
 		name="Polyline",
 		description="Sequentially connect data points as a polygon line",
 		default=False)
+	polyline_closed: bpy.props.BoolProperty(
+		name="Closed",
+		description="Connect the last point of each polygon line back to the first",
+		default=False)
+	polyline_break: bpy.props.EnumProperty(
+		name='Lines',
+		description='Split grid based polygon lines into separate rows or columns',
+		items=[
+			('NONE', 'Continuous', 'Connect every point in a single line'),
+			('ROW', 'Rows', 'Create a separate line for each row along X'),
+			('COLUMN', 'Columns', 'Create a separate line for each column along Y')
+			],
+		default='NONE')
 	
 	# Cubic Grid settings
 	grid_count: bpy.props.IntVectorProperty(
@@ -595,9 +659,9 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 		default=1000,
 		step=10,
 		soft_min=10,
-		soft_max=1000,
+		soft_max=10000,
 		min=1,
-		max=10000,)
+		max=1000000,)
 	max_failures: bpy.props.IntProperty(
 		name="Failures",
 		description="The maximum number of consecutive failures before quitting (higher numbers won't give up when the odds are poor)",
@@ -745,6 +809,44 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 		precision=3,
 		soft_min=-1.0,
 		soft_max=1.0)
+	offset_falloff: bpy.props.EnumProperty(
+		name='Falloff',
+		description='Fade the offset with distance from the centre point',
+		items=[
+			('NONE', 'Constant', 'Apply the full offset to every selected vertex'),
+			('LINEAR', 'Linear', 'Linear falloff from the centre point to the falloff radius'),
+			('SMOOTH', 'Smooth', 'Smoothstep falloff from the centre point to the falloff radius'),
+			('SMOOTHER', 'Smoother', 'Smootherstep falloff from the centre point to the falloff radius'),
+			('POWER', 'Custom', 'Custom power curve falloff from the centre point to the falloff radius')
+			],
+		default='NONE')
+	offset_falloff_radius: bpy.props.FloatProperty(
+		name="Radius",
+		description="Distance from the centre point where the offset fades to zero",
+		subtype="DISTANCE",
+		default=1.0,
+		step=1.25,
+		precision=3,
+		min=0.0001,
+		soft_min=0.01,
+		soft_max=10.0)
+	offset_falloff_power: bpy.props.FloatProperty(
+		name="Exponent",
+		description="Falloff curve exponent, values below 1.0 hold the offset further out while values above 1.0 fade it sooner",
+		default=2.0,
+		step=10,
+		precision=2,
+		min=0.01,
+		soft_min=0.1,
+		soft_max=8.0)
+	offset_selected: bpy.props.BoolProperty(
+		name="All Selected Objects",
+		description="Offset every selected mesh object around a shared world space centre point",
+		default=False)
+	offset_vertex_group: bpy.props.StringProperty(
+		name="Vertex Group",
+		description="Optional vertex group used to weight the offset of each vertex",
+		default="")
 	
 	
 	
@@ -843,6 +945,14 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 		min=0,
 		soft_min=0.0,
 		soft_max=1.0)
+	vert_merge: bpy.props.BoolProperty(
+		name="Merge Coincident",
+		description="Merge selected vertices that snap to the same position",
+		default=False)
+	quantize_selected: bpy.props.BoolProperty(
+		name="All Selected Objects",
+		description="Quantize every selected mesh object instead of only the active object",
+		default=False)
 	uv_type: bpy.props.EnumProperty(
 		name='Space',
 		description='Planar projection coordinate space',
@@ -912,7 +1022,7 @@ class MeshKitSettings(bpy.types.PropertyGroup):
 # •Unregistration function
 
 classes = (MeshKitPreferences, MeshKitSettings,
-	MeshKit_Vertex_Quantize, MeshKit_UV_Quantize, MESHKIT_PT_vertex_quantize, MESHKIT_PT_uv_quantize)
+	MeshKit_Vertex_Quantize, MeshKit_Vertex_Quantize_Modal, MeshKit_UV_Quantize, MESHKIT_PT_vertex_quantize, MESHKIT_PT_uv_quantize)
 
 keymaps = []
 
@@ -1,4 +1,15 @@
 import bpy
+import numpy as np
+import time
+import zlib
+from mathutils import Matrix
+
+
+# Reusable float32 coordinate buffer, grown on demand so repeated alignments don't reallocate
+_co_buffer = np.empty(0, dtype=np.float32)
+
+# Exact bounds per object and source, stored with the checksum of the geometry they were computed from
+_bounds_cache = {}
 
 
 # ---- Helpers -----------------------------------------------------------------
@@ -15,6 +26,64 @@ def get_bbox_min_max(obj):
 	return min(bbx), max(bbx), min(bby), max(bby), min(bbz), max(bbz)
 
 
+def get_vertex_bounds(mesh, selected_only, key):
+	"""
+	Returns exact (min_x, max_x, min_y, max_y, min_z, max_z) of the mesh vertices, or None if there are none.
+	A checksum of the coordinates (and selection) is compared against the cache entry for key,
+	so unchanged geometry skips the reduction entirely.
+	"""
+	global _co_buffer
+	count = len(mesh.vertices)
+	if _co_buffer.size < count * 3:
+		_co_buffer = np.empty(count * 3, dtype=np.float32)
+	co = _co_buffer[:count * 3]
+	mesh.vertices.foreach_get('co', co)
+	checksum = zlib.crc32(co)
+	sel = None
+	if selected_only:
+		sel = np.empty(count, dtype=bool)
+		mesh.vertices.foreach_get('select', sel)
+		checksum = zlib.crc32(sel, checksum)
+	
+	cached = _bounds_cache.get(key)
+	if cached is not None and cached[0] == (count, checksum):
+		return cached[1]
+	
+	co = co.reshape(count, 3)
+	if sel is not None:
+		co = co[sel]
+	if len(co) == 0:
+		return None
+	min_co = co.min(axis=0).tolist()
+	max_co = co.max(axis=0).tolist()
+	bounds = (min_co[0], max_co[0], min_co[1], max_co[1], min_co[2], max_co[2])
+	_bounds_cache[key] = ((count, checksum), bounds)
+	return bounds
+
+
+def get_bounds(obj, source, depsgraph):
+	"""
+	Returns (min_x, max_x, min_y, max_y, min_z, max_z) in local space from the chosen source:
+	'BOX' object bounding box, 'VERTS' raw vertices, 'SELECTED' selected vertices, or 'EVALUATED' evaluated mesh.
+	"""
+	if source == 'BOX':
+		return get_bbox_min_max(obj)
+	
+	key = (obj.name_full, source)
+	if source == 'EVALUATED':
+		obj_eval = obj.evaluated_get(depsgraph)
+		mesh = obj_eval.to_mesh()
+		try:
+			return get_vertex_bounds(mesh, False, key)
+		finally:
+			obj_eval.to_mesh_clear()
+	
+	# Flush edit-mode changes into the mesh data without leaving edit mode
+	if obj.mode == 'EDIT':
+		obj.update_from_editmode()
+	return get_vertex_bounds(obj.data, source == 'SELECTED', key)
+
+
 def compute_offsets(min_x, max_x, min_y, max_y, min_z, max_z, align_x, align_y, align_z):
 	"""Compute (dx, dy, dz) needed to align mesh bounding box to origin according to settings."""
 	# Horizontal
@@ -50,37 +119,56 @@ def compute_offsets(min_x, max_x, min_y, max_y, min_z, max_z, align_x, align_y,
 	return dx, dy, dz
 
 
+def translate_vertices_buffered(mesh, dx, dy, dz):
+	"""
+	Translate all mesh vertices with a single foreach_get/add/foreach_set pass.
+	Uses the module level float32 buffer, so only the first (or a larger) mesh allocates memory.
+	"""
+	global _co_buffer
+	size = len(mesh.vertices) * 3
+	if _co_buffer.size < size:
+		_co_buffer = np.empty(size, dtype=np.float32)
+	co = _co_buffer[:size]
+	mesh.vertices.foreach_get('co', co)
+	# The offset stays in double precision, matching the rounding of adding to each Vector
+	co.reshape(-1, 3)[:] += np.array((dx, dy, dz), dtype=np.float64)
+	mesh.vertices.foreach_set('co', co)
+
+
 def translate_mesh_local(obj, dx, dy, dz):
 	"""
 	Translate all mesh vertices in local space by (dx, dy, dz).
-	Handles edit/object mode safely and preserves the user's current mode.
+	Meshes without edit-mode state are moved directly with Mesh.transform, otherwise
+	edit mode is flushed, the buffered translation is applied, and the user's mode is restored.
 	"""
 	if obj.type != 'MESH':
 		return {'CANCELLED'}
 	
+	mesh = obj.data
+	
+	# No edit-mode data to sync, transform the mesh in place
+	if not mesh.is_editmode:
+		mesh.transform(Matrix.Translation((dx, dy, dz)))
+		mesh.update()
+		return {'FINISHED'}
+	
 	# Remember mode to restore later
-	current_mode = bpy.context.mode
+	current_mode = obj.mode
 	
 	# Ensure we can edit data
-	if current_mode != 'OBJECT':
-		bpy.ops.object.mode_set(mode='OBJECT')
+	bpy.ops.object.mode_set(mode='OBJECT')
 	
 	# Shift all verts
-	verts = obj.data.vertices
-	for v in verts:
-		v.co.x += dx
-		v.co.y += dy
-		v.co.z += dz
+	translate_vertices_buffered(mesh, dx, dy, dz)
 	
 	# Update depsgraph/viewports
-	obj.data.update()
+	mesh.update()
 	
 	# Restore prior mode
-	if current_mode != 'OBJECT':
-		try:
-			bpy.ops.object.mode_set(mode=current_mode)
-		except Exception:
-			pass
+	try:
+		bpy.ops.object.mode_set(mode=current_mode)
+	except Exception:
+		pass
 	
 	return {'FINISHED'}
 
@@ -107,8 +195,16 @@ class OBJECT_OT_mesh_align_origin(bpy.types.Operator):
 			self.report({'WARNING'}, "Active object is not a mesh.")
 			return {'CANCELLED'}
 		
+		# Batch mode for every selected mesh
+		if context.scene.mesh_kit_settings.mesh_align_selected:
+			return self.align_selected(context)
+		
 		# Get bounding box
-		min_x, max_x, min_y, max_y, min_z, max_z = get_bbox_min_max(obj)
+		bounds = get_bounds(obj, context.scene.mesh_kit_settings.mesh_align_bounds, context.evaluated_depsgraph_get())
+		if bounds is None:
+			self.report({'WARNING'}, "No vertices to measure.")
+			return {'CANCELLED'}
+		min_x, max_x, min_y, max_y, min_z, max_z = bounds
 		
 		# Compute offsets
 		dx, dy, dz = compute_offsets(
@@ -128,6 +224,53 @@ class OBJECT_OT_mesh_align_origin(bpy.types.Operator):
 		if 'FINISHED' in result:
 			self.report({'INFO'}, f"Shifted geometry by ΔX={dx:.6f}, ΔY={dy:.6f}, ΔY={dz:.6f}.")
 		return result
+	
+	def align_selected(self, context):
+		"""Align every selected mesh with the current settings, translating each shared mesh datablock only once."""
+		settings = context.scene.mesh_kit_settings
+		timer = time.perf_counter()
+		
+		# Collect unique meshes, keeping the first object that uses each one for its bounding box
+		targets = {}
+		for obj in [context.active_object] + list(context.selected_objects):
+			if obj.type == 'MESH' and obj.data not in targets:
+				targets[obj.data] = obj
+		
+		# Leave edit mode once for the whole batch, so every mesh can be transformed directly
+		current_mode = context.active_object.mode
+		if current_mode != 'OBJECT':
+			bpy.ops.object.mode_set(mode='OBJECT')
+		
+		depsgraph = context.evaluated_depsgraph_get()
+		shifted = 0
+		for mesh, obj in targets.items():
+			bounds = get_bounds(obj, settings.mesh_align_bounds, depsgraph)
+			if bounds is None:
+				continue
+			dx, dy, dz = compute_offsets(
+				*bounds,
+				settings.mesh_align_x,
+				settings.mesh_align_y,
+				settings.mesh_align_z
+			)
+			if abs(dx) < 1e-10 and abs(dy) < 1e-10 and abs(dz) < 1e-10:
+				continue
+			translate_mesh_local(obj, dx, dy, dz)
+			shifted += 1
+		
+		# Restore prior mode
+		if current_mode != 'OBJECT':
+			try:
+				bpy.ops.object.mode_set(mode=current_mode)
+			except Exception:
+				pass
+		
+		if shifted == 0:
+			self.report({'INFO'}, "Already aligned with the chosen settings.")
+			return {'CANCELLED'}
+		
+		self.report({'INFO'}, f"Aligned {shifted} of {len(targets)} meshes in {time.perf_counter() - timer:.3f}s.")
+		return {'FINISHED'}
 
 
 # ---- Panel --------------------------------------------------------------------
@@ -160,6 +303,8 @@ class MESHKIT_PT_mesh_align_origin(bpy.types.Panel):
 		row3.prop(context.scene.mesh_kit_settings, 'mesh_align_z', expand=True)
 		
 		col.separator()
+		col.prop(context.scene.mesh_kit_settings, 'mesh_align_bounds', text='')
+		col.prop(context.scene.mesh_kit_settings, 'mesh_align_selected')
 		col.operator(OBJECT_OT_mesh_align_origin.bl_idname, icon='PIVOT_CURSOR')
 		# PIVOT_CURSOR OBJECT_ORIGIN EMPTY_AXIS ORIENTATION_CURSOR PIVOT_BOUNDBOX MOD_WIREFRAME CUBE LIGHTPROBE_SPHERE
 
@@ -0,0 +1,28 @@
+import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+###########################################################################
+# Shared array helpers
+
+def read_vertices(mesh):
+	"""Return (n, 3) float32 coordinates and a boolean selection mask for every mesh vertex"""
+	count = len(mesh.vertices)
+	co = np.empty(count * 3, dtype=np.float32)
+	sel = np.empty(count, dtype=bool)
+	mesh.vertices.foreach_get('co', co)
+	mesh.vertices.foreach_get('select', sel)
+	return co.reshape(count, 3), sel
+
+def write_vertices(mesh, co):
+	"""Write (n, 3) coordinates back to the mesh vertices in a single call"""
+	mesh.vertices.foreach_set('co', np.ascontiguousarray(co, dtype=np.float32).ravel())
+	mesh.update()
+
+def process_buffers(function, buffers):
+	"""Run function over each buffer on a thread pool, NumPy releases the GIL while it works through the arrays
+	The buffers must be plain data resolved on the main thread, the workers must not touch Blender data"""
+	if len(buffers) < 2:
+		return [function(buffer) for buffer in buffers]
+	with ThreadPoolExecutor(max_workers=min(len(buffers), os.cpu_count() or 1)) as pool:
+		return list(pool.map(function, buffers))
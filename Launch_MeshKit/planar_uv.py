@@ -1,6 +1,277 @@
 import bpy
 import bmesh
-from mathutils import Vector
+import numpy as np
+from .mesh_arrays import process_buffers
+
+###########################################################################
+# Projection helpers
+
+# Source coordinate indices for U, V, and the projection axis itself
+AXIS_INDICES = {'X': (1, 2, 0), 'Y': (0, 2, 1), 'Z': (0, 1, 2)}
+
+def projection_frame(settings, matrix=None):
+	"""Return a 4x4 matrix that maps homogeneous local positions into the normalised projection frame
+	When a world matrix is provided the positions are converted to world space first"""
+	centre = np.array(settings.projection_centre, dtype=np.float64)
+	size = np.array(settings.projection_size, dtype=np.float64)
+	# Prevent divide by zero errors
+	size = np.where(size > 0.0, size, 1.0)
+	frame = np.identity(4)
+	frame[:3, :3] = np.diag(1.0 / size)
+	frame[:3, 3] = -centre / size
+	if matrix is not None:
+		frame = frame @ np.array(matrix, dtype=np.float64)
+	return frame
+
+def projection_affine(settings):
+	"""Return a 2x3 matrix applying the rotation, flip, and alignment settings to (U, V, 1) coordinates"""
+	rotation = settings.projection_rotation
+	affine = np.identity(2)
+	# 90° swaps the axes and inverts the new U
+	if "YX" in rotation:
+		affine = np.array([[0.0, -1.0], [1.0, 0.0]])
+	# 180° inverts both axes
+	if "-" in rotation:
+		affine = -affine
+	# Flip only applies to U
+	affine[0] *= float(settings.projection_flip)
+	align = float(settings.projection_align)
+	return np.hstack((affine, [[align], [align]]))
+
+def planar_matrix(settings, matrix=None):
+	"""Return the 2x4 affine matrix projecting homogeneous local positions straight to UV coordinates
+	World space, centre and size, axis swizzle, rotation, flip, and alignment are all folded into this single matrix"""
+	frame = projection_frame(settings, matrix)
+	u, v, _ = AXIS_INDICES[settings.projection_axis]
+	swizzle = np.vstack((frame[u], frame[v], (0.0, 0.0, 0.0, 1.0)))
+	return projection_affine(settings) @ swizzle
+
+def projection_parameters(settings, matrix=None):
+	"""Resolve the projection settings (and optional world matrix) into plain NumPy data
+	This keeps project_loops free of Blender data access, so it can run on worker threads"""
+	mode = settings.projection_mode
+	normals = np.identity(3)
+	if mode == 'BOX' and matrix is not None:
+		# Face normals are row vectors, so multiplying by the inverse applies the inverse transpose
+		# The safe inverse keeps objects flattened with a zero scale working instead of raising on a singular matrix
+		normals = np.array(matrix.to_3x3().inverted_safe(), dtype=np.float64)
+	return {
+		'mode': mode,
+		'axis': AXIS_INDICES[settings.projection_axis],
+		'frame': projection_frame(settings, matrix),
+		'affine': projection_affine(settings),
+		'planar': planar_matrix(settings, matrix),
+		'normals': normals,
+	}
+
+def unwrap_seams(u, faces):
+	"""Shift the negative side of faces that straddle the ±0.5 wrap of an angular U coordinate, so they don't stretch across the whole map"""
+	if len(u) == 0:
+		return u
+	starts = np.flatnonzero(np.r_[True, faces[1:] != faces[:-1]])
+	span = np.maximum.reduceat(u, starts) - np.minimum.reduceat(u, starts)
+	wrapped = np.repeat(span > 0.5, np.diff(np.r_[starts, len(u)]))
+	return np.where(wrapped & (u < 0.0), u + 1.0, u)
+
+def project_loops(parameters, positions, normals, faces):
+	"""Return (n, 2) UV coordinates for homogeneous loop positions using the planar, box, cylindrical, or spherical mode"""
+	mode = parameters['mode']
+	if mode == 'PLANAR':
+		return positions @ parameters['planar'].T
+	
+	# Normalised positions within the projection frame
+	local = positions @ parameters['frame'][:3].T
+	
+	if mode == 'BOX':
+		# Project each face along the dominant axis of its normal, mirroring U on the negative sides so images read correctly
+		normals = normals @ parameters['normals']
+		axis = np.argmax(np.abs(normals), axis=1)
+		rows = np.arange(len(axis))
+		side = np.where(normals[rows, axis] < 0.0, -1.0, 1.0)
+		u = local[rows, np.array((1, 0, 0))[axis]] * side
+		v = local[rows, np.array((2, 2, 1))[axis]]
+	else:
+		# Wrap around the projection axis, U is the angle and V the height (cylinder) or latitude (sphere)
+		a, b, axis = parameters['axis']
+		u = unwrap_seams(np.arctan2(local[:, b], local[:, a]) / (2.0 * np.pi), faces)
+		if mode == 'CYLINDER':
+			v = local[:, axis]
+		else:
+			radius = np.linalg.norm(local, axis=1)
+			v = np.arcsin(np.clip(np.divide(local[:, axis], radius, out=np.zeros_like(radius), where=radius > 0.0), -1.0, 1.0)) / np.pi
+	
+	affine = parameters['affine']
+	return np.column_stack((u, v)) @ affine[:, :2].T + affine[:, 2]
+
+def read_selected_vertices(mesh):
+	"""Return (n, 3) float32 positions of the selected mesh vertices"""
+	co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+	mesh.vertices.foreach_get('co', co)
+	sel = np.empty(len(mesh.vertices), dtype=bool)
+	mesh.vertices.foreach_get('select', sel)
+	return co.reshape(-1, 3)[sel]
+
+def read_selected_loops(mesh):
+	"""Return data for every loop of the selected faces: homogeneous (n, 4) vertex positions, (n, 3) face normals,
+	the face index of each loop, and the loop selection mask"""
+	co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+	mesh.vertices.foreach_get('co', co)
+	loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+	mesh.loops.foreach_get('vertex_index', loop_verts)
+	face_sel = np.empty(len(mesh.polygons), dtype=bool)
+	mesh.polygons.foreach_get('select', face_sel)
+	loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+	mesh.polygons.foreach_get('loop_total', loop_total)
+	face_normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+	mesh.polygons.foreach_get('normal', face_normals)
+	
+	# Face loops are stored contiguously, so face data expands directly to the loop domain
+	loop_sel = np.repeat(face_sel, loop_total)
+	positions = np.ones((int(loop_sel.sum()), 4), dtype=np.float64)
+	positions[:, :3] = co.reshape(-1, 3)[loop_verts[loop_sel]]
+	normals = np.repeat(face_normals.reshape(-1, 3), loop_total, axis=0)[loop_sel].astype(np.float64)
+	faces = np.repeat(np.arange(len(mesh.polygons)), loop_total)[loop_sel]
+	return positions, normals, faces, loop_sel
+
+def write_selected_uvs(mesh, loop_sel, uv):
+	"""Write UV coordinates for the selected loops into the active UV map (created if missing) with a single foreach_set"""
+	uv_layer = mesh.uv_layers.active or mesh.uv_layers.new()
+	data = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+	uv_layer.data.foreach_get('uv', data)
+	data = data.reshape(-1, 2)
+	data[loop_sel] = uv
+	uv_layer.data.foreach_set('uv', data.ravel())
+	mesh.update()
+
+def face_texel_density(mesh, matrix):
+	"""Return the per-face texel density of the active UV map, the square root of UV area over world space area
+	Areas are summed from the loop triangles of each face, faces without any 3D area return NaN"""
+	mesh.calc_loop_triangles()
+	tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+	mesh.loop_triangles.foreach_get('loops', tris)
+	tri_faces = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+	mesh.loop_triangles.foreach_get('polygon_index', tri_faces)
+	co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+	mesh.vertices.foreach_get('co', co)
+	loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+	mesh.loops.foreach_get('vertex_index', loop_verts)
+	uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+	mesh.uv_layers.active.data.foreach_get('uv', uv)
+	
+	# World space triangle corners, so density is comparable between objects of different scale
+	mat = np.array(matrix, dtype=np.float64)
+	points = (co.reshape(-1, 3).astype(np.float64) @ mat[:3, :3].T + mat[:3, 3])[loop_verts[tris]].reshape(-1, 3, 3)
+	area_3d = 0.5 * np.linalg.norm(np.cross(points[:, 1] - points[:, 0], points[:, 2] - points[:, 0]), axis=1)
+	corners = uv.reshape(-1, 2).astype(np.float64)[tris].reshape(-1, 3, 2)
+	edge_a = corners[:, 1] - corners[:, 0]
+	edge_b = corners[:, 2] - corners[:, 0]
+	area_uv = 0.5 * np.abs(edge_a[:, 0] * edge_b[:, 1] - edge_a[:, 1] * edge_b[:, 0])
+	
+	# Accumulate triangle areas per face
+	face_3d = np.bincount(tri_faces, weights=area_3d, minlength=len(mesh.polygons))
+	face_uv = np.bincount(tri_faces, weights=area_uv, minlength=len(mesh.polygons))
+	ratio = np.divide(face_uv, face_3d, out=np.full(len(face_3d), np.nan), where=face_3d > 0.0)
+	return np.sqrt(ratio)
+
+def write_face_attribute(mesh, name, values, face_sel):
+	"""Write float values for the selected faces into a face attribute (created if missing or of the wrong type)"""
+	attribute = mesh.attributes.get(name)
+	if attribute is not None and (attribute.domain != 'FACE' or attribute.data_type != 'FLOAT'):
+		mesh.attributes.remove(attribute)
+		attribute = None
+	if attribute is None:
+		attribute = mesh.attributes.new(name=name, type='FLOAT', domain='FACE')
+	data = np.empty(len(mesh.polygons), dtype=np.float32)
+	attribute.data.foreach_get('value', data)
+	data[face_sel] = np.nan_to_num(values[face_sel])
+	attribute.data.foreach_set('value', data)
+
+def projection_targets(context):
+	"""Return the mesh objects to project, either the active object or every selected mesh object
+	Only the first object using each mesh is returned, since a shared mesh can only hold one mapping"""
+	objects = [context.active_object]
+	if context.scene.mesh_kit_settings.projection_selected:
+		objects += [obj for obj in context.selected_objects if obj != context.active_object]
+	targets = []
+	for obj in objects:
+		if obj is not None and obj.type == 'MESH' and obj.data not in [target.data for target in targets]:
+			targets.append(obj)
+	return targets
+
+###########################################################################
+# Live preview
+
+# Loop data and interaction mode cached per object name, so property tweaks only need the vectorised projection and a UV write
+_live_cache = {}
+_live_pending = False
+
+def live_cache_build(context):
+	"""Cache the selected loop data and mode of every projection target, plus the selected BMesh loops of edit mode meshes"""
+	_live_cache.clear()
+	for obj in projection_targets(context):
+		if obj.mode == 'EDIT':
+			obj.update_from_editmode()
+		positions, normals, faces, loop_sel = read_selected_loops(obj.data)
+		loops = None
+		if obj.mode == 'EDIT':
+			# Edit mode UVs live in the BMesh, face loop order matches the mesh loop order after the update above
+			bm = bmesh.from_edit_mesh(obj.data)
+			loops = [loop for face in bm.faces for loop in face.loops]
+			loops = [loops[i] for i in np.flatnonzero(loop_sel)]
+		_live_cache[obj.name] = (obj.mode, positions, normals, faces, loop_sel, loops)
+
+def live_refresh():
+	"""Timer callback that reprojects the cached loops with the current settings"""
+	global _live_pending
+	_live_pending = False
+	context = bpy.context
+	settings = context.scene.mesh_kit_settings
+	if not settings.projection_live:
+		return None
+	world = True if settings.projection_space == "W" else False
+	
+	# Rebuild when an object has changed mode since caching, mesh writes are lost underneath an edit mode BMesh
+	for name, entry in _live_cache.items():
+		obj = bpy.data.objects.get(name)
+		if obj is not None and obj.mode != entry[0]:
+			live_cache_build(context)
+			break
+	
+	try:
+		for name, (mode, positions, normals, faces, loop_sel, loops) in _live_cache.items():
+			obj = bpy.data.objects.get(name)
+			# Skip objects that have been removed or had their topology changed since caching
+			if obj is None or obj.type != 'MESH' or len(obj.data.loops) != len(loop_sel):
+				continue
+			uv = project_loops(projection_parameters(settings, obj.matrix_world if world else None), positions, normals, faces)
+			
+			if loops is None:
+				write_selected_uvs(obj.data, loop_sel, uv)
+			else:
+				# BMesh has no bulk UV setter, so edit mode meshes are written per loop
+				layer = bmesh.from_edit_mesh(obj.data).loops.layers.uv.verify()
+				for loop, value in zip(loops, uv.tolist()):
+					loop[layer].uv = value
+				bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+	except ReferenceError:
+		# Cached BMesh loops were freed (mode change or undo), rebuild for the next update
+		live_cache_build(context)
+	
+	return None
+
+def meshkit_planar_uv_live_update(self, context):
+	"""Property update callback that schedules a throttled live refresh"""
+	global _live_pending
+	if self.projection_live and not _live_pending:
+		_live_pending = True
+		bpy.app.timers.register(live_refresh, first_interval=0.05)
+
+def meshkit_planar_uv_live_toggle(self, context):
+	"""Property update callback that builds or clears the live preview cache"""
+	_live_cache.clear()
+	if self.projection_live:
+		live_cache_build(context)
+		meshkit_planar_uv_live_update(self, context)
 
 ###########################################################################
 # Main class
@@ -8,7 +279,7 @@ from mathutils import Vector
 class MeshKit_UV_Planar_Projection(bpy.types.Operator):
 	bl_idname = "ops.meshkit_uv_planar_projection"
 	bl_label = "Set UV Map"
-	bl_description = "Numerical planar projection of 3D meshes into UV space"
+	bl_description = "Numerical planar, box, cylindrical, or spherical projection of 3D meshes into UV space"
 	bl_options = {'REGISTER', 'UNDO'}
 	
 	def execute(self, context):
@@ -16,80 +287,52 @@ class MeshKit_UV_Planar_Projection(bpy.types.Operator):
 			return {'CANCELLED'}
 		
 		# Set up local variables
-		axis = context.scene.mesh_kit_settings.projection_axis
-		world = True if context.scene.mesh_kit_settings.projection_space == "W" else False
-		rotation = context.scene.mesh_kit_settings.projection_rotation
-		flip = float(context.scene.mesh_kit_settings.projection_flip)
-		align = float(context.scene.mesh_kit_settings.projection_align)
-		centre = context.scene.mesh_kit_settings.projection_centre
-		size = context.scene.mesh_kit_settings.projection_size
-		
-		# Prevent divide by zero errors
-		size[0] = size[0] if size[0] > 0.0 else 1.0
-		size[1] = size[1] if size[1] > 0.0 else 1.0
-		size[2] = size[2] if size[2] > 0.0 else 1.0
+		settings = context.scene.mesh_kit_settings
+		world = True if settings.projection_space == "W" else False
 		
 		# Save current mode
 		mode = context.active_object.mode
-		# Switch to edit mode
-		bpy.ops.object.mode_set(mode='EDIT')
+		# Switch to object mode so face selection and UV data are in sync with the mesh
+		bpy.ops.object.mode_set(mode='OBJECT')
+		
+		# Gather loop positions and build each combined projection matrix on the main thread
+		# In world space every object shares the same projection frame, so neighbouring meshes line up
+		objects = projection_targets(context)
+		buffers = [read_selected_loops(obj.data) for obj in objects]
+		parameters = [projection_parameters(settings, obj.matrix_world if world else None) for obj in objects]
 		
-		# Get object
-		obj = context.active_object
-		mat = obj.matrix_world
-		bm = bmesh.from_edit_mesh(obj.data)
-		# Get UV map
-		uv_layer = bm.loops.layers.uv.verify()
+		# Map every selected loop of each object in a single pass on the worker threads
+		def project(job):
+			(positions, normals, faces, loop_sel), projection = job
+			return project_loops(projection, positions, normals, faces)
+		results = process_buffers(project, list(zip(buffers, parameters)))
 		
-		# Loop through faces
-		U = 0.0
-		V = 0.0
-		for f in bm.faces:
-			if f.select:
-				for l in f.loops:
-					# Process input coordinates
-					# Use copy() to prevent changes to the source vertex coordinates
-					pos = l.vert.co.copy()
-					
-					# Convert to world space if enabled
-					if world:
-						pos = mat @ pos
-					
-					pos[0] = (pos[0] - centre[0]) / size[0]
-					pos[1] = (pos[1] - centre[1]) / size[1]
-					pos[2] = (pos[2] - centre[2]) / size[2]
-					
-					# Projection Axis
-					if axis == "X":
-						U = pos[1]
-						V = pos[2]
-					elif axis == "Y":
-						U = pos[0]
-						V = pos[2]
-					else: # axis == "Z"
-						U = pos[0]
-						V = pos[1]
-					
-					# Projection Rotation
-					if "YX" in rotation:
-						U, V = V, U
-						U *= -1.0
-					if "-" in rotation:
-						U *= -1.0
-						V *= -1.0
-					
-					# Projection Flip
-					U *= flip
-					
-					# Set UV map values with image centre or zero point alignment
-					l[uv_layer].uv = (U + align, V + align)
+		# Write UVs back on the main thread
+		for obj, buffer, uv in zip(objects, buffers, results):
+			write_selected_uvs(obj.data, buffer[-1], uv)
 		
-		# Update mesh
-		bmesh.update_edit_mesh(obj.data)
+		# Measure the texel density of every projected face and store it as a face attribute
+		if settings.projection_density:
+			densities = []
+			for obj in objects:
+				mesh = obj.data
+				face_sel = np.empty(len(mesh.polygons), dtype=bool)
+				mesh.polygons.foreach_get('select', face_sel)
+				density = face_texel_density(mesh, obj.matrix_world)
+				write_face_attribute(mesh, "texel_density", density, face_sel)
+				densities.append(density[face_sel])
+			densities = np.concatenate(densities) if densities else np.empty(0)
+			densities = densities[np.isfinite(densities)]
+			if len(densities):
+				self.report({'INFO'}, f"Texel density (UV/m): min {densities.min():.4f}, median {np.median(densities):.4f}, max {densities.max():.4f}")
 		
 		# Reset object mode to original
 		bpy.ops.object.mode_set(mode=mode)
 		
+		# Mode switching frees any cached edit mode loops, so refresh the live preview cache
+		if settings.projection_live:
+			live_cache_build(context)
+		
 		# Done
 		return {'FINISHED'}
 
@@ -103,51 +346,48 @@ class MeshKit_UV_Load_Selection(bpy.types.Operator):
 		if not context.view_layer.objects.active.data.vertices:
 			return {'CANCELLED'}
 		
-		# Save current mode
-		mode = context.active_object.mode
-		# Switch to edit mode
-		bpy.ops.object.mode_set(mode='EDIT')
-		
-		# Get object data
-		obj = context.active_object
-		mat = obj.matrix_world
-		mesh = bmesh.from_edit_mesh(obj.data)
+		# Set up local variables
+		settings = context.scene.mesh_kit_settings
+		world = True if settings.projection_space == "W" else False
+		min_co = np.full(3, np.inf)
+		max_co = np.full(3, -np.inf)
 		
-		# Loop through selected vertices and find the minimum/maximum positions
-		min_co = Vector((float("inf"), float("inf"), float("inf")))
-		max_co = Vector((float("-inf"), float("-inf"), float("-inf")))
-		for vert in mesh.verts:
-			if vert.select:
-				min_co.x = min(min_co.x, vert.co.x)
-				min_co.y = min(min_co.y, vert.co.y)
-				min_co.z = min(min_co.z, vert.co.z)
-				max_co.x = max(max_co.x, vert.co.x)
-				max_co.y = max(max_co.y, vert.co.y)
-				max_co.z = max(max_co.z, vert.co.z)
+		# Reduce the selected vertices of every target object into a single bounding box
+		for obj in projection_targets(context):
+			# Flush edit mode changes (including selection) into the mesh data without leaving edit mode
+			if obj.mode == 'EDIT':
+				obj.update_from_editmode()
+			points = read_selected_vertices(obj.data).astype(np.float64)
+			if len(points) == 0:
+				continue
+			
+			# Convert every selected point to world space if enabled, so rotated objects give exact extents
+			if world:
+				mat = np.array(obj.matrix_world, dtype=np.float64)
+				points = points @ mat[:3, :3].T + mat[:3, 3]
+			
+			min_co = np.minimum(min_co, points.min(axis=0))
+			max_co = np.maximum(max_co, points.max(axis=0))
 		
-		# Convert to world space if enabled
-		if context.scene.mesh_kit_settings.projection_space == "W":
-			min_co = mat @ min_co
-			max_co = mat @ max_co
+		# Nothing selected
+		if not np.isfinite(min_co).all():
+			self.report({'WARNING'}, "No selected vertices found")
+			return {'CANCELLED'}
 		
 		# Calculate bounding box and centre point
 		centr = (min_co + max_co) * 0.5
-		max_co = max_co - min_co
+		size = max_co - min_co
 		
 		# Prevent zero scale entries
-		if max_co.x == 0:
-			max_co.x = 1.0
-		if max_co.y == 0:
-			max_co.y = 1.0
-		if max_co.z == 0:
-			max_co.z = 1.0
+		size[size == 0.0] = 1.0
 		
-		# Set local variables
-		context.scene.mesh_kit_settings.projection_centre = centr
-		context.scene.mesh_kit_settings.projection_size = max_co
+		# Pick up selection changes in the live preview cache before the property updates trigger a refresh
+		if settings.projection_live:
+			live_cache_build(context)
 		
-		# Reset object mode to original
-		bpy.ops.object.mode_set(mode=mode)
+		# Set local variables
+		settings.projection_centre = centr.tolist()
+		settings.projection_size = size.tolist()
 		
 		# Done
 		return {'FINISHED'}
@@ -179,7 +419,9 @@ class MESHKIT_PT_planar_uv(bpy.types.Panel):
 			layout = self.layout
 			layout.use_property_split = True
 			layout.use_property_decorate = False # No animation
-			layout.prop(context.scene.mesh_kit_settings, 'projection_axis', expand=True)
+			layout.prop(context.scene.mesh_kit_settings, 'projection_mode')
+			if context.scene.mesh_kit_settings.projection_mode != 'BOX':
+				layout.prop(context.scene.mesh_kit_settings, 'projection_axis', expand=True)
 			
 			col = layout.column()
 			col.prop(context.scene.mesh_kit_settings, 'projection_centre')
@@ -187,6 +429,9 @@ class MESHKIT_PT_planar_uv(bpy.types.Panel):
 			col.prop(context.scene.mesh_kit_settings, 'projection_size')
 			
 			layout.prop(context.scene.mesh_kit_settings, 'projection_space', expand=True)
+			layout.prop(context.scene.mesh_kit_settings, 'projection_selected')
+			layout.prop(context.scene.mesh_kit_settings, 'projection_live')
+			layout.prop(context.scene.mesh_kit_settings, 'projection_density')
 			
 			button = layout.row()
 			if not (context.view_layer.objects.active and context.view_layer.objects.active.type == "MESH"):
@@ -253,6 +498,9 @@ def register():
 
 
 def unregister():
+	if bpy.app.timers.is_registered(live_refresh):
+		bpy.app.timers.unregister(live_refresh)
+	_live_cache.clear()
 	for cls in reversed(classes):
 		bpy.utils.unregister_class(cls)
 
@@ -1,9 +1,9 @@
 import bpy
 import bmesh
-from random import uniform
 from mathutils import Vector
 import math
 import time
+import threading
 # Data import support
 from pathlib import Path
 import numpy as np
@@ -11,6 +11,368 @@ import re
 # Volume Field import support
 import struct
 
+###########################################################################
+# Mesh helpers
+
+def write_point_mesh(mesh, positions, attributes=(), edges=None):
+	"""Replace the mesh geometry with loose points (and optional edges) using bulk foreach_set writes
+	Attributes are a list of (name, type, values) tuples stored in the point domain"""
+	mesh.clear_geometry()
+	mesh.vertices.add(len(positions))
+	mesh.vertices.foreach_set('co', np.ascontiguousarray(positions, dtype=np.float32).ravel())
+	if edges is not None:
+		add_edges(mesh, edges)
+	for name, data_type, values in attributes:
+		# Replace any attribute left over from earlier geometry
+		if mesh.attributes.get(name) is not None:
+			mesh.attributes.remove(mesh.attributes[name])
+		attribute = mesh.attributes.new(name=name, type=data_type, domain='POINT')
+		if data_type == 'FLOAT_VECTOR':
+			attribute.data.foreach_set('vector', np.ascontiguousarray(values, dtype=np.float32).ravel())
+		else:
+			attribute.data.foreach_set('value', np.ascontiguousarray(values, dtype=np.int32 if data_type == 'INT' else np.float32).ravel())
+	mesh.update() # This ensures the viewport updates
+
+def add_edges(mesh, edges):
+	"""Append (n, 2) vertex index pairs to the mesh as edges with a single foreach_set"""
+	if len(edges) == 0:
+		return
+	start = len(mesh.edges)
+	mesh.edges.add(len(edges))
+	data = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+	mesh.edges.foreach_get('vertices', data)
+	data[start * 2:] = np.ascontiguousarray(edges, dtype=np.int32).ravel()
+	mesh.edges.foreach_set('vertices', data)
+
+def polyline_edges(lines, closed=False):
+	"""Return (n, 2) vertex index pairs connecting each row of a 2D index array as a separate polyline
+	Closed lines also connect the last point of each row back to the first"""
+	lines = np.atleast_2d(lines)
+	if closed and lines.shape[1] > 2:
+		lines = np.hstack((lines, lines[:, :1]))
+	return np.stack((lines[:, :-1], lines[:, 1:]), axis=-1).reshape(-1, 2)
+
+def grid_lines(grid_x, grid_y, grid_z, mode='NONE'):
+	"""Return polyline index rows for a grid stored in swizzled Y-Z-X order
+	Either a single continuous line, one line per row along X, or one line per column along Y"""
+	index = np.arange(grid_x * grid_y * grid_z).reshape(grid_y, grid_z, grid_x)
+	if mode == 'ROW':
+		return index.reshape(-1, grid_x)
+	if mode == 'COLUMN':
+		return index.transpose(1, 2, 0).reshape(-1, grid_y)
+	return index.reshape(1, -1)
+
+def polyline_settings_edges(settings, count, grid=None):
+	"""Return the polyline edges for count points using the polyline settings, or None when disabled
+	Grid based generators pass their (x, y, z) counts so lines can be broken per row or column"""
+	if not settings.polyline:
+		return None
+	lines = grid_lines(*grid, settings.polyline_break) if grid is not None else np.arange(count)
+	return polyline_edges(lines, settings.polyline_closed)
+
+
+
+###########################################################################
+# Poisson disc packing
+
+# Grid hash cells are packed into a single integer key, so neighbouring cells are found by adding precomputed offsets
+# NumPy keys wrap around at 64 bits, which can only merge distant cells and never hides a true neighbour
+HASH_SPAN = 1 << 21
+
+def hash_key(x, y, z, cell):
+	"""Return the grid hash cell key containing a point"""
+	return (math.floor(x / cell) * HASH_SPAN + math.floor(y / cell)) * HASH_SPAN + math.floor(z / cell)
+
+def hash_keys(positions, cell):
+	"""Return the int64 grid hash cell keys of (n, 3) positions"""
+	cells = np.floor(positions / cell).astype(np.int64)
+	with np.errstate(over='ignore'):
+		return (cells[:, 0] * HASH_SPAN + cells[:, 1]) * HASH_SPAN + cells[:, 2]
+
+def hash_offsets(reach=(1, 1, 1)):
+	"""Return the key offsets of every grid hash cell within reach (in cells along each axis) of a point's own cell
+	Nearer cells come first, since they are the most likely to hold an overlapping point"""
+	x, y, z = (range(-r, r + 1) for r in reach)
+	cells = sorted(((i, j, k) for i in x for j in y for k in z), key=lambda c: c[0]*c[0] + c[1]*c[1] + c[2]*c[2])
+	return [(i * HASH_SPAN + j) * HASH_SPAN + k for i, j, k in cells]
+
+# Offsets of the 27 grid hash cells surrounding (and including) a point's own cell
+NEIGHBOUR_CELLS = hash_offsets()
+
+def hash_overlaps(grid, points, cell, x, y, z, radius):
+	"""Return True if a point of the given radius overlaps any accepted point in the neighbouring grid hash cells"""
+	key = hash_key(x, y, z, cell)
+	for offset in NEIGHBOUR_CELLS:
+		for i in grid.get(key + offset, ()):
+			p = points[i]
+			if (p[0]-x)**2 + (p[1]-y)**2 + (p[2]-z)**2 < (p[3] + radius)**2:
+				return True
+	return False
+
+def hash_insert(grid, points, cell, point):
+	"""Accept a (x, y, z, radius) point, adding it to the point list and the grid hash"""
+	grid.setdefault(hash_key(point[0], point[1], point[2], cell), []).append(len(points))
+	points.append(point)
+
+# Offsets of the 9 grid hash columns surrounding a point's own cell, Z is the lowest key digit so each column of 3 cells is one key range
+NEIGHBOUR_COLUMNS = hash_offsets((1, 1, 0))
+
+def sorted_overlaps(keys, points, positions, radii, cell):
+	"""Return a mask of the (n, 3) candidates overlapping any point of a (m, 4) array sorted by its grid hash keys
+	Each neighbouring column of cells is found with a binary search, so every candidate is tested in a handful of vectorised passes"""
+	hit = np.zeros(len(positions), dtype=bool)
+	if len(points) == 0 or len(positions) == 0:
+		return hit
+	# Sorted candidates make the binary searches cache friendly
+	candidate_keys = hash_keys(positions, cell)
+	order = np.argsort(candidate_keys)
+	candidate_keys = candidate_keys[order]
+	positions = positions[order]
+	radii = radii[order]
+	for offset in NEIGHBOUR_COLUMNS:
+		target = candidate_keys + offset
+		start = np.searchsorted(keys, target - 1, 'left')
+		span = np.searchsorted(keys, target + 1, 'right') - start
+		# Step through the points of each column in parallel, dropping candidates once they collide
+		slot = 0
+		while True:
+			rows = np.flatnonzero((span > slot) & ~hit)
+			if len(rows) == 0:
+				break
+			p = points[start[rows] + slot]
+			hit[rows] = ((p[:, :3] - positions[rows])**2).sum(axis=1) < (p[:, 3] + radii[rows])**2
+			slot += 1
+	# Return the mask in the original candidate order
+	result = np.empty_like(hit)
+	result[order] = hit
+	return result
+
+def shape_mask(positions, radii, size, shape, within, trim):
+	"""Fit (n, 3) candidate positions to the area shape, returning the fitted positions and a mask of the candidates inside it
+	Hull candidates are projected onto the ellipsoid surface, all other shapes are masked by the (optionally radius compensated) volume"""
+	size = np.asarray(size, dtype=np.float64)
+	if shape == "HULL":
+		scale = np.maximum(size, 0.0000001)
+		normal = positions / scale
+		length = np.linalg.norm(normal, axis=1, keepdims=True)
+		normal = normal / np.where(length > 0.0, length, 1.0)
+		# Check to see if the point is too far out of bounds
+		return normal * scale, normal[:, 2] >= trim
+	# Set up edge limits (if enabled) and prevent divide-by-zero errors
+	limits = np.maximum(size - radii[:, np.newaxis] if within else np.broadcast_to(size, positions.shape), 0.0000001)
+	mask = (np.abs(positions) <= limits).all(axis=1)
+	# Check if point is within circular or spherical bounds (if enabled)
+	if shape == "SPHERE":
+		mask &= ((positions / limits)**2).sum(axis=1) < 1.0
+	elif shape == "CYLINDER":
+		mask &= ((positions[:, :2] / limits[:, :2])**2).sum(axis=1) < 1.0
+	return positions, mask
+
+def pack_candidates(rng, total, size, shape, within, trim, scale_min, scale_max):
+	"""Draw random candidate radii and positions within the area, returning (positions, radii, mask) with the mask from shape_mask"""
+	# The scale settings are independent, so either one may be the larger bound
+	radii = rng.uniform(*sorted((scale_min, scale_max)), total)
+	if shape == "HULL":
+		# This is a super easy way to generate random, albeit NOT evenly random, hulls...only works at full size, and begins to exhibit corner density when the trim value is above -1
+		positions = np.column_stack((rng.uniform(-1.0, 1.0, (total, 2)), rng.uniform(trim, 1.0, total))) * size
+	else:
+		# Set up edge limits (if enabled) and prevent divide-by-zero errors
+		limits = np.maximum(size - radii[:, np.newaxis] if within else np.broadcast_to(size, (total, 3)), 0.0000001)
+		positions = rng.uniform(-1.0, 1.0, (total, 3)) * limits
+	positions, mask = shape_mask(positions, radii, size, shape, within, trim)
+	return positions, radii, mask
+
+def pack_points(elements, failures, attempts, size, shape, within, trim, scale_min, scale_max, rng=None, state=None, batch=4096):
+	"""Poisson disc sampling by dart throwing, returning (points, failmax, iteration) where points is an (n, 4) array of x, y, z, radius
+	Candidates are drawn and masked in NumPy batches, then tested against the points of earlier batches with a vectorised grid hash lookup.
+	The survivors are resolved against each other in a greedy sequential pass, which also keeps the attempt and failure counters exact
+	All random values are drawn from the provided NumPy generator, so a seeded generator gives a reproducible layout
+	An optional state dictionary receives progress ('count' and 'attempts') and stops the run early when 'cancel' is set"""
+	rng = rng if rng is not None else np.random.default_rng()
+	size = np.asarray(size, dtype=np.float64)
+	cell = 2.0 * max(scale_min, scale_max) # sized by the largest radius that can be drawn, whichever setting holds it
+	points = np.empty((0, 4), dtype=np.float64)
+	lookup = np.empty((0, 4), dtype=np.float64)
+	keys = np.empty(0, dtype=np.int64)
+	count = 0
+	failmax = 0 # This is entirely for reporting purposes and is not needed structurally
+	iteration = 0
+	
+	# Loop until we're too tired to continue...
+	while len(points) < elements and count < failures and iteration < attempts:
+		# Stop early if a background run was cancelled, keeping the points accepted so far
+		if state is not None and state['cancel']:
+			break
+		
+		# Larger batches amortise the cost of re-sorting the accepted points
+		total = min(attempts - iteration, max(batch, min(len(points) // 2, batch * 16)))
+		
+		# Generate random radii and positions
+		positions, radii, mask = pack_candidates(rng, total, size, shape, within, trim, scale_min, scale_max)
+		
+		# Reject candidates overlapping points from earlier batches
+		rows = np.flatnonzero(mask)
+		mask[rows] = ~sorted_overlaps(keys, lookup, positions[rows], radii[rows], cell)
+		
+		# Greedy pass over the surviving candidates in order, so those conflicting with earlier ones in the same batch are rejected
+		# Rejected candidates in between only advance the counters, exactly as if they had been tried one at a time
+		grid = {}
+		accepted = []
+		end = total
+		last = -1
+		for i in np.flatnonzero(mask):
+			if count + (i - last - 1) >= failures:
+				end = last + 1 + failures - count
+				count = failures
+				break
+			count += i - last
+			last = i
+			x, y, z = positions[i]
+			# If no collisions are detected, add the point to the list and reset the failure counter
+			if not hash_overlaps(grid, accepted, cell, x, y, z, radii[i]):
+				hash_insert(grid, accepted, cell, (x, y, z, radii[i]))
+				failmax = max(failmax, count) # This is entirely for reporting purposes and is not needed structurally
+				count = 0
+				if len(points) + len(accepted) >= elements:
+					end = i + 1
+					break
+			elif count >= failures:
+				end = i + 1
+				break
+		else:
+			# Rejected candidates after the last survivor
+			if count + (total - 1 - last) >= failures:
+				end = last + 1 + failures - count
+				count = failures
+			else:
+				count += total - 1 - last
+		iteration += int(end)
+		
+		# Merge the accepted points, keeping a copy sorted by grid hash key for the next batch (a stable sort merges the two sorted runs in linear time)
+		if accepted:
+			accepted = np.array(accepted, dtype=np.float64)
+			points = np.concatenate((points, accepted))
+			keys = np.concatenate((keys, hash_keys(accepted[:, :3], cell)))
+			order = np.argsort(keys, kind='stable')
+			keys = keys[order]
+			lookup = np.concatenate((lookup, accepted))[order]
+		
+		# Report progress to a background run
+		if state is not None:
+			state['count'] = len(points)
+			state['attempts'] = iteration
+	
+	# One last check, in case the stop cause was maximum failure count and this value wasn't updated in a successful check status
+	failmax = max(failmax, count) # This is entirely for reporting purposes and is not needed structurally
+	
+	return points, failmax, iteration
+
+def bridson_points(elements, size, shape, within, trim, scale_min, scale_max, rng=None, state=None, candidates=30, batch=1024):
+	"""Bridson's Poisson disc sampling with variable radii, returning (points, failmax, iteration) like pack_points
+	Each active point spawns a batch of candidates just beyond touching distance, and retires once they all fail, filling the area in near linear time
+	A whole batch of active points is expanded at once, so every candidate is tested with the same vectorised grid hash lookup as pack_points
+	Progress and cancellation use the same optional state dictionary as pack_points"""
+	rng = rng if rng is not None else np.random.default_rng()
+	hull = shape == "HULL"
+	size = np.asarray(size, dtype=np.float64)
+	cell = 2.0 * max(scale_min, scale_max) # sized by the largest radius that can be drawn, whichever setting holds it
+	points = np.empty((0, 4), dtype=np.float64)
+	lookup = points
+	keys = np.empty(0, dtype=np.int64)
+	active = np.empty(0, dtype=np.int64)
+	count = 0
+	failmax = 0 # This is entirely for reporting purposes and is not needed structurally
+	iteration = 0
+	
+	# Only spawn candidates along dimensions with some extent, so flat areas don't waste candidates out of plane
+	axes = np.array([(s - min(scale_min, scale_max) if within and not hull else s) > 0.0000001 for s in size])
+	
+	# Seed the first point somewhere inside the area, using the same (radius compensated) limits as pack_points
+	while len(points) == 0 and iteration < candidates * 100:
+		positions, radii, mask = pack_candidates(rng, candidates, size, shape, within, trim, scale_min, scale_max)
+		if not mask.any():
+			iteration += candidates
+			count += candidates
+			continue
+		first = int(np.argmax(mask))
+		iteration += first + 1
+		count += first + 1
+		points = lookup = np.append(positions[first], radii[first])[np.newaxis]
+		keys = hash_keys(points[:, :3], cell)
+		active = np.zeros(1, dtype=np.int64)
+		failmax = max(failmax, count)
+		count = 0
+	
+	# Spawn candidates around batches of random active points until the area is full or the target is reached
+	while len(active) > 0 and len(points) < elements:
+		# Report progress to a background run, stopping early if it was cancelled
+		if state is not None:
+			if state['cancel']:
+				break
+			state['count'] = len(points)
+			state['attempts'] = iteration
+		
+		chosen = rng.permutation(len(active))[:batch]
+		parents = points[active[chosen]]
+		
+		# Random directions within the sampled dimensions, at distances just beyond touching so neighbours pack tightly
+		radii = rng.uniform(*sorted((scale_min, scale_max)), (len(parents), candidates))
+		directions = rng.normal(size=(len(parents), candidates, 3)) * axes
+		length = np.linalg.norm(directions, axis=2)
+		directions /= np.where(length > 0.0, length, 1.0)[:, :, np.newaxis]
+		distance = (parents[:, 3:] + radii) * rng.uniform(1.000001, 1.02, radii.shape)
+		radii = radii.ravel()
+		positions, mask = shape_mask((parents[:, np.newaxis, :3] + directions * distance[:, :, np.newaxis]).reshape(-1, 3), radii, size, shape, within, trim)
+		iteration += len(radii)
+		
+		# Test every candidate from its own (possibly projected) position against the accepted points
+		rows = np.flatnonzero(mask)
+		mask[rows] = ~sorted_overlaps(keys, lookup, positions[rows], radii[rows], cell)
+		mask = mask.reshape(len(parents), candidates)
+		valid = mask.any(axis=1)
+		
+		# Greedy pass over the first valid candidate of each parent, so those conflicting with earlier ones in the same batch are rejected
+		grid = {}
+		accepted = []
+		for i in (np.flatnonzero(valid) * candidates + np.argmax(mask, axis=1)[valid]).tolist():
+			x, y, z = positions[i]
+			if not hash_overlaps(grid, accepted, cell, x, y, z, radii[i]):
+				hash_insert(grid, accepted, cell, (x, y, z, radii[i]))
+				if len(points) + len(accepted) >= elements:
+					break
+		
+		# Retire points that can no longer spawn neighbours, parents that only lost a conflict in this batch stay active
+		retired = np.zeros(len(active), dtype=bool)
+		retired[chosen[~valid]] = True
+		active = active[~retired]
+		
+		# Track failed candidates between accepted points
+		count += len(radii) - len(accepted)
+		if accepted:
+			failmax = max(failmax, count) # This is entirely for reporting purposes and is not needed structurally
+			count = 0
+			
+			# Merge the accepted points, keeping a copy sorted by grid hash key like pack_points
+			accepted = np.array(accepted, dtype=np.float64)
+			active = np.concatenate((active, np.arange(len(points), len(points) + len(accepted))))
+			points = np.concatenate((points, accepted))
+			keys = np.concatenate((keys, hash_keys(accepted[:, :3], cell)))
+			order = np.argsort(keys, kind='stable')
+			keys = keys[order]
+			lookup = np.concatenate((lookup, accepted))[order]
+	
+	# One last check, in case the final candidates all failed
+	failmax = max(failmax, count) # This is entirely for reporting purposes and is not needed structurally
+	
+	# Report the final progress, the loop only updates it before each batch
+	if state is not None:
+		state['count'] = len(points)
+		state['attempts'] = iteration
+	
+	return points, failmax, iteration
+
+
+
 ###########################################################################
 # Main classes
 
@@ -46,62 +408,40 @@ class MeshKit_Point_Grid(bpy.types.Operator):
 		else:
 			object_mode = None
 		
-		# Create a new bmesh
-		bm = bmesh.new()
-		
-		# Set up attribute layers
-		# We don't need to check for an existing vertex layer because this is a fresh Bmesh
-		pf = bm.verts.layers.float.new('factor')
-		pix = bm.verts.layers.int.new('index_x')
-		piy = bm.verts.layers.int.new('index_y')
-		piz = bm.verts.layers.int.new('index_z')
-		ps = bm.verts.layers.float.new('scale')
-		pr = bm.verts.layers.float_vector.new('rotation')
+		# Grid indices in swizzled Y-Z-X channel order (X changes fastest) to support Volume Fields export to Unity
+		index_y, index_z, index_x = (index.ravel() for index in np.meshgrid(np.arange(grid_y), np.arange(grid_z), np.arange(grid_x), indexing='ij'))
+		count = len(index_x)
 		
-		# Advanced attribute layers
-		relativeX = 0.0 if grid_x == 1 else 1.0 / ((float(grid_x) - 1) * space)
-		relativeY = 0.0 if grid_y == 1 else 1.0 / ((float(grid_y) - 1) * space)
-		relativeZ = 0.0 if grid_z == 1 else 1.0 / ((float(grid_z) - 1) * space)
-		pu = bm.verts.layers.float_vector.new('position_relative')
-		pd = bm.verts.layers.float.new('position_distance')
+		# Create points
+		positions = np.empty((count, 3), dtype=np.float64)
+		positions[:, 0] = (index_x - grid_x*0.5 + 0.5)*space
+		positions[:, 1] = (index_y - grid_y*0.5 + 0.5)*space
+		positions[:, 2] = (index_z + 0.5)*space if ground else (index_z - grid_z*0.5 + 0.5)*space
 		
-		# Range setup
-		count = grid_x * grid_y * grid_z - 1.0
-		i = 0
+		# Advanced attributes
+		relative = np.array([0.0 if grid_x == 1 else 1.0 / ((float(grid_x) - 1) * space), 0.0 if grid_y == 1 else 1.0 / ((float(grid_y) - 1) * space), 0.0 if grid_z == 1 else 1.0 / ((float(grid_z) - 1) * space)])
+		position_relative = positions * relative * np.array([2.0, 2.0, 1.0 if ground else 2.0])
 		
-		# Create points
-		for _y in range(0, grid_y): # Swizzled channel order to support Volume Fields export to Unity
-			for _z in range(0, grid_z): # Swizzled channel order to support Volume Fields export to Unity
-				for _x in range(0, grid_x):
-					pointX = (float(_x) - grid_x*0.5 + 0.5)*space
-					pointY = (float(_y) - grid_y*0.5 + 0.5)*space
-					if ground:
-						pointZ = (float(_z) + 0.5)*space
-						positionRelative = Vector([pointX * relativeX * 2.0, pointY * relativeY * 2.0, pointZ * relativeZ])
-					else:
-						pointZ = (float(_z) - grid_z*0.5 + 0.5)*space
-						positionRelative = Vector([pointX * relativeX * 2.0, pointY * relativeY * 2.0, pointZ * relativeZ * 2.0])
-					v = bm.verts.new((pointX, pointY, pointZ))
-					v[pf] = 0.0 if i == 0.0 else i / count
-					v[pix] = _x
-					v[piy] = _y
-					v[piz] = _z
-					v[ps] = scale_max if not scale_random else uniform(scale_min, scale_max)
-					v[pr] = Vector([0.0, 0.0, 0.0]) if not rotation_rand else Vector([uniform(-math.pi, math.pi), uniform(-math.pi, math.pi), uniform(-math.pi, math.pi)])
-					v[pu] = positionRelative
-					v[pd] = positionRelative.length
-					i += 1
+		# Point attributes
+		rng = np.random.default_rng(bpy.context.scene.mesh_kit_settings.seed)
+		factor = np.arange(count) / max(count - 1.0, 1.0)
+		scale = np.full(count, scale_max) if not scale_random else rng.uniform(*sorted((scale_min, scale_max)), count)
+		rotation = np.zeros((count, 3)) if not rotation_rand else rng.uniform(-math.pi, math.pi, (count, 3))
 		
 		# Connect vertices
-		if bpy.context.scene.mesh_kit_settings.polyline:
-			bm.verts.ensure_lookup_table()
-			for i in range(len(bm.verts)-1):
-				bm.edges.new([bm.verts[i], bm.verts[i+1]])
+		edges = polyline_settings_edges(bpy.context.scene.mesh_kit_settings, count, (grid_x, grid_y, grid_z))
 		
 		# Replace object with new mesh data
-		bm.to_mesh(obj.data)
-		bm.free()
-		obj.data.update() # This ensures the viewport updates
+		write_point_mesh(obj.data, positions, [
+			('factor', 'FLOAT', factor),
+			('index_x', 'INT', index_x),
+			('index_y', 'INT', index_y),
+			('index_z', 'INT', index_z),
+			('scale', 'FLOAT', scale),
+			('rotation', 'FLOAT_VECTOR', rotation),
+			('position_relative', 'FLOAT_VECTOR', position_relative),
+			('position_distance', 'FLOAT', np.linalg.norm(position_relative, axis=1)),
+		], edges)
 		
 		# Store the grid settings to custom mesh properties
 		if obj.type == 'MESH':
@@ -148,40 +488,34 @@ class MeshKit_Point_Golden(bpy.types.Operator):
 		else:
 			object_mode = None
 		
-		# Create a new bmesh
-		bm = bmesh.new()
-		
-		# Set up attribute layers
-		pf = bm.verts.layers.float.new('factor')
-		ps = bm.verts.layers.float.new('scale')
-		pr = bm.verts.layers.float_vector.new('rotation')
-		
+		# Spiral points
+		# The original code incorrectly set the starting vertex at 0...and while Fermat's Spiral can benefit from an extra point near the start, the exact centre does not work
 		if fill:
-			v = bm.verts.new((space * 0.8660254037844386467637231707529361834714026269051903140279034897, 0.0, 0.0)) # Magic value: sin(60°)
-			v[pf] = 0
-			v[ps] = scale_max if not scale_random else uniform(scale_min, scale_max)
-			v[pr] = Vector([0.0, 0.0, 0.0]) if not rotation_rand else Vector([uniform(-math.pi, math.pi), uniform(-math.pi, math.pi), uniform(-math.pi, math.pi)])
 			count -= 1
+		i = np.arange(1, count + 1)
+		#theta = i * math.radians(137.5)
+		theta = i * 2.3999632297286533222315555066336138531249990110581150429351127507 # many thanks to WolframAlpha for the numerical accuracy
+		r = space * np.sqrt(i)
+		positions = np.column_stack((np.cos(theta) * r, np.sin(theta) * r, np.zeros(count)))
+		factor = i / max(count, 1) if fill else (i - 1.0) / max(count - 1.0, 1.0)
+		
+		# Extra point filling the visual gap near the centre
+		if fill:
+			positions = np.vstack(([space * 0.8660254037844386467637231707529361834714026269051903140279034897, 0.0, 0.0], positions)) # Magic value: sin(60°)
+			factor = np.concatenate(([0.0], factor))
 		
-		for i in range(1, count+1): # The original code incorrectly set the starting vertex at 0...and while Fermat's Spiral can benefit from an extra point near the start, the exact centre does not work
-			#theta = i * math.radians(137.5)
-			theta = i * 2.3999632297286533222315555066336138531249990110581150429351127507 # many thanks to WolframAlpha for the numerical accuracy
-			r = space * math.sqrt(i)
-			v = bm.verts.new((math.cos(theta) * r, math.sin(theta) * r, 0.0))
-			v[pf] = i / count if bpy.context.scene.mesh_kit_settings.golden_fill else (0.0 if i == 1 else (i - 1.0) / (count - 1.0))
-			v[ps] = scale_max if not scale_random else uniform(scale_min, scale_max)
-			v[pr] = Vector([0.0, 0.0, 0.0]) if not rotation_rand else Vector([uniform(-math.pi, math.pi), uniform(-math.pi, math.pi), uniform(-math.pi, math.pi)])
-		
-		# Connect vertices
-		if bpy.context.scene.mesh_kit_settings.polyline:
-			bm.verts.ensure_lookup_table()
-			for i in range(len(bm.verts)-1):
-				bm.edges.new([bm.verts[i], bm.verts[i+1]])
+		# Point attributes
+		rng = np.random.default_rng(bpy.context.scene.mesh_kit_settings.seed)
+		total = len(positions)
+		scale = np.full(total, scale_max) if not scale_random else rng.uniform(*sorted((scale_min, scale_max)), total)
+		rotation = np.zeros((total, 3)) if not rotation_rand else rng.uniform(-math.pi, math.pi, (total, 3))
 		
 		# Replace object with new mesh data
-		bm.to_mesh(obj.data)
-		bm.free()
-		obj.data.update() # This ensures the viewport updates
+		write_point_mesh(obj.data, positions, [
+			('factor', 'FLOAT', factor),
+			('scale', 'FLOAT', scale),
+			('rotation', 'FLOAT_VECTOR', rotation),
+		], polyline_settings_edges(bpy.context.scene.mesh_kit_settings, total))
 		
 		# Reset to original mode
 		if object_mode is not None:
@@ -191,28 +525,30 @@ class MeshKit_Point_Golden(bpy.types.Operator):
 
 
 
+# Progress of the running background pack, shared between the worker thread and the main thread
+pack_state = {}
+
 class MeshKit_Point_Pack(bpy.types.Operator):
 	bl_idname = "ops.meshkit_create_point_pack"
 	bl_label = "Replace Mesh"
-	bl_description = "Create points using the selected options, deleting and replacing the currently selected mesh"
+	bl_description = "Create points using the selected options, deleting and replacing the currently selected mesh (press Esc to stop early and keep the points created so far)"
 	bl_options = {'REGISTER', 'UNDO'}
 	
-	def execute(self, context):
-		elements = bpy.context.scene.mesh_kit_settings.max_elements # target number of points
-		failures = bpy.context.scene.mesh_kit_settings.max_failures # maximum number of consecutive failures
-		attempts = bpy.context.scene.mesh_kit_settings.max_attempts # maximum number of iterations to try and meet the target number of points
-		shapeX = bpy.context.scene.mesh_kit_settings.area_size[0] * 0.5 # X distribution radius
-		shapeY = bpy.context.scene.mesh_kit_settings.area_size[1] * 0.5 # Y distribution radius
-		shapeZ = bpy.context.scene.mesh_kit_settings.area_size[2] * 0.5 # Z distribution radius
-		circular = True if bpy.context.scene.mesh_kit_settings.area_shape == "CYLINDER" else False # enable circular masking
-		spherical = True if bpy.context.scene.mesh_kit_settings.area_shape == "SPHERE" else False # enable spherical masking
-		hull = True if bpy.context.scene.mesh_kit_settings.area_shape == "HULL" else False # enable spherical hull masking
-		trim = bpy.context.scene.mesh_kit_settings.area_truncate * 2.0 - 1.0 # trim hull extent
-		within = True if bpy.context.scene.mesh_kit_settings.area_alignment == "RADIUS" else False # enable radius compensation to force all elements to fit within the shape boundary
+	def prepare(self, context):
+		"""Read the settings and switch the target object to object mode, returning False if no mesh is selected"""
+		self.elements = bpy.context.scene.mesh_kit_settings.max_elements # target number of points
+		self.failures = bpy.context.scene.mesh_kit_settings.max_failures # maximum number of consecutive failures
+		self.attempts = bpy.context.scene.mesh_kit_settings.max_attempts # maximum number of iterations to try and meet the target number of points
+		self.shape = (bpy.context.scene.mesh_kit_settings.area_size[0] * 0.5, bpy.context.scene.mesh_kit_settings.area_size[1] * 0.5, bpy.context.scene.mesh_kit_settings.area_size[2] * 0.5) # XYZ distribution radius
+		self.trim = bpy.context.scene.mesh_kit_settings.area_truncate * 2.0 - 1.0 # trim hull extent
+		self.within = True if bpy.context.scene.mesh_kit_settings.area_alignment == "RADIUS" else False # enable radius compensation to force all elements to fit within the shape boundary
 		scale_random = bpy.context.scene.mesh_kit_settings.scale_random
-		scale_max = bpy.context.scene.mesh_kit_settings.scale_maximum # maximum radius of the generated point
-		scale_min = scale_max if not scale_random else bpy.context.scene.mesh_kit_settings.scale_minimum # minimum radius of the generated point
-		rotation_rand = bpy.context.scene.mesh_kit_settings.rotation_random
+		self.scale_max = bpy.context.scene.mesh_kit_settings.scale_maximum # maximum radius of the generated point
+		self.scale_min = self.scale_max if not scale_random else bpy.context.scene.mesh_kit_settings.scale_minimum # minimum radius of the generated point
+		self.rotation_rand = bpy.context.scene.mesh_kit_settings.rotation_random
+		self.area_shape = bpy.context.scene.mesh_kit_settings.area_shape
+		self.bridson = bpy.context.scene.mesh_kit_settings.array_type == "BRIDSON"
+		self.rng = np.random.default_rng(bpy.context.scene.mesh_kit_settings.seed)
 		
 		# Get the selected object
 		obj = bpy.context.object
@@ -220,136 +556,151 @@ class MeshKit_Point_Pack(bpy.types.Operator):
 		# Stop processing if no valid mesh is found
 		if obj is None or obj.type != 'MESH':
 			print('Mesh Kit Point Array error: no mesh object selected')
-			return {'CANCELLED'}
+			return False
+		self.object_name = obj.name
 		
 		# Switch out of editing mode if active
 		if obj.mode != 'OBJECT':
-			object_mode = obj.mode
+			self.object_mode = obj.mode
 			bpy.ops.object.mode_set(mode = 'OBJECT')
 		else:
-			object_mode = None
-		
-		# Create a new bmesh
-		bm = bmesh.new()
-		
-		# Set up attribute layers
-		pf = bm.verts.layers.float.new('factor')
-		ps = bm.verts.layers.float.new('scale')
-		pr = bm.verts.layers.float_vector.new('rotation')
-		
-		# Advanced attribute layers...designed for some pretty specific projects, but may be helpful in others
-		relativeX = 0.0 if shapeX == 0.0 else 1.0 / shapeX
-		relativeY = 0.0 if shapeY == 0.0 else 1.0 / shapeY
-		relativeZ = 0.0 if shapeZ == 0.0 else 1.0 / shapeZ
-		pu = bm.verts.layers.float_vector.new('position_relative')
-		pd = bm.verts.layers.float.new('position_distance')
+			self.object_mode = None
 		
 		# Start timer
-		timer = str(time.time())
-		
+		self.timer = time.time()
+		return True
+	
+	def kernel(self):
+		"""Return the packing function and a plain tuple of its arguments, so a worker thread can run it without touching the operator"""
 		# Create points with poisson disc sampling
-		points = []
-		count = 0
-		failmax = 0 # This is entirely for reporting purposes and is not needed structurally
-		iteration = 0
-		
-		# Loop until we're too tired to continue...
-		while len(points) < elements and count < failures and iteration < attempts:
-			iteration += 1
-			count += 1
-			# Create check system (this prevents unnecessary cycles by exiting early if possible)
-			check = 0
-			
-			# Generate random radius
-			radius = uniform(scale_min, scale_max)
-			
-			# Create volume
-			x = shapeX
-			y = shapeY
-			z = shapeZ
-			
-			if hull:
-				# Create normalised vector for the hull shape
-				# This is a super easy way to generate random, albeit NOT evenly random, hulls...only works at full size, and begins to exhibit corner density when the trim value is above -1
-				temp = Vector([uniform(-1.0, 1.0), uniform(-1.0, 1.0), uniform(trim, 1.0)]).normalized()
-				# Check to see if the point is too far out of bounds
-				if (temp[2] < trim):
-					check = 1
-				# Create point definition with radius
-				point = [temp[0]*x, temp[1]*y, temp[2]*z, radius]
-			else:
-				# Set up edge limits (if enabled)
-				if within:
-					x -= radius
-					y -= radius
-					z -= radius
-				# Prevent divide-by-zero errors
-				x = max(x, 0.0000001)
-				y = max(y, 0.0000001)
-				z = max(z, 0.0000001)
-				# Create point definition with radius
-				point = [uniform(-x, x), uniform(-y, y), uniform(-z, z), radius]
-				# Check if point is within circular or spherical bounds (if enabled)
-				if spherical:
-					check = int(Vector([point[0]/x, point[1]/y, point[2]/z]).length)
-				elif circular:
-					check = int(Vector([point[0]/x, point[1]/y, 0.0]).length)
-			
-			# Check if it overlaps with other radii
-			i = 0
-			while i < len(points) and check == 0:
-				if Vector([points[i][0]-point[0], points[i][1]-point[1], points[i][2]-point[2]]).length < (points[i][3] + point[3]):
-					check = 1
-				i += 1
-			
-			# If no collisions are detected, add the point to the list and reset the failure counter
-			if check == 0:
-				points.append(point)
-				failmax = max(failmax, count) # This is entirely for reporting purposes and is not needed structurally
-				# if count > failuresHalf: # This is a hard-coded efficiency attempt, dropping the maximum scale if we're getting a lot of failures
-				# 	scale_max = mediumR
-				count = 0
+		if self.bridson:
+			return bridson_points, (self.elements, self.shape, self.area_shape, self.within, self.trim, self.scale_min, self.scale_max, self.rng)
+		return pack_points, (self.elements, self.failures, self.attempts, self.shape, self.area_shape, self.within, self.trim, self.scale_min, self.scale_max, self.rng)
+	
+	def restore_mode(self, context):
+		"""Reset the target object to its original mode"""
+		obj = bpy.data.objects.get(self.object_name)
+		if obj is not None and self.object_mode is not None and context.view_layer.objects.active == obj:
+			bpy.ops.object.mode_set(mode = self.object_mode)
+	
+	def finish(self, context, result):
+		"""Write the packed points into the target mesh in one bulk write and restore the original mode"""
+		obj = bpy.data.objects.get(self.object_name)
+		if obj is None or obj.type != 'MESH':
+			print('Mesh Kit Point Array error: target mesh object was removed')
+			return {'CANCELLED'}
 		
-		# One last check, in case the stop cause was maximum failure count and this value wasn't updated in a successful check status
-		failmax = max(failmax, count) # This is entirely for reporting purposes and is not needed structurally
+		points, failmax, iteration = result
+		points = np.array(points, dtype=np.float64).reshape(-1, 4)
+		count = len(points)
+		shapeX, shapeY, shapeZ = self.shape
 		
-		# Range setup
-		count = len(points) - 1.0
-		i = 0.0
+		# Advanced attributes...designed for some pretty specific projects, but may be helpful in others
+		relative = np.array([0.0 if shapeX == 0.0 else 1.0 / shapeX, 0.0 if shapeY == 0.0 else 1.0 / shapeY, 0.0 if shapeZ == 0.0 else 1.0 / shapeZ])
+		position_relative = points[:, :3] * relative
 		
-		# This creates vertices from the points list
-		for p in points:
-			v = bm.verts.new((p[0], p[1], p[2]))
-			v[pf] = 0.0 if i == 0.0 else i / count
-			i += 1.0
-			v[ps] = p[3]
-			v[pr] = Vector([0.0, 0.0, 0.0]) if not rotation_rand else Vector([uniform(-math.pi, math.pi), uniform(-math.pi, math.pi), uniform(-math.pi, math.pi)])
-			positionRelative = Vector([p[0] * relativeX, p[1] * relativeY, p[2] * relativeZ])
-			v[pu] = positionRelative
-			v[pd] = positionRelative.length
+		# Point attributes
+		factor = np.arange(count) / max(count - 1.0, 1.0)
+		rotation = np.zeros((count, 3)) if not self.rotation_rand else self.rng.uniform(-math.pi, math.pi, (count, 3))
 		
 		# Update the feedback strings
-		context.scene.mesh_kit_settings.feedback_elements = str(len(points))
+		context.scene.mesh_kit_settings.feedback_elements = str(count)
 		context.scene.mesh_kit_settings.feedback_failures = str(failmax)
 		context.scene.mesh_kit_settings.feedback_attempts = str(iteration)
-		context.scene.mesh_kit_settings.feedback_time = str(round(time.time() - float(timer), 2))
-		
-		# Connect vertices
-		if bpy.context.scene.mesh_kit_settings.polyline:
-			bm.verts.ensure_lookup_table()
-			for i in range(len(bm.verts)-1):
-				bm.edges.new([bm.verts[i], bm.verts[i+1]])
+		context.scene.mesh_kit_settings.feedback_time = str(round(time.time() - self.timer, 2))
 		
 		# Replace object with new mesh data
-		bm.to_mesh(obj.data)
-		bm.free()
-		obj.data.update() # This ensures the viewport updates
+		write_point_mesh(obj.data, points[:, :3], [
+			('factor', 'FLOAT', factor),
+			('scale', 'FLOAT', points[:, 3]),
+			('rotation', 'FLOAT_VECTOR', rotation),
+			('position_relative', 'FLOAT_VECTOR', position_relative),
+			('position_distance', 'FLOAT', np.linalg.norm(position_relative, axis=1)),
+		], polyline_settings_edges(bpy.context.scene.mesh_kit_settings, count))
 		
 		# Reset to original mode
-		if object_mode is not None:
-			bpy.ops.object.mode_set(mode = object_mode)
+		self.restore_mode(context)
 		
 		return {'FINISHED'}
+	
+	def execute(self, context):
+		if not self.prepare(context):
+			return {'CANCELLED'}
+		function, args = self.kernel()
+		return self.finish(context, function(*args))
+	
+	def invoke(self, context, event):
+		# Only one background run at a time
+		if pack_state.get('thread') is not None and pack_state['thread'].is_alive():
+			self.report({'WARNING'}, "Point packing is already running")
+			return {'CANCELLED'}
+		if not self.prepare(context):
+			return {'CANCELLED'}
+		
+		# Run the kernel on a worker thread, the main thread keeps the interface responsive
+		pack_state.clear()
+		pack_state.update({'count': 0, 'attempts': 0, 'cancel': False, 'result': None, 'error': None, 'start': self.timer})
+		function, args = self.kernel()
+		def work():
+			try:
+				pack_state['result'] = function(*args, pack_state)
+			except Exception as exc:
+				pack_state['error'] = exc
+		pack_state['thread'] = threading.Thread(target=work, daemon=True)
+		pack_state['thread'].start()
+		
+		# Stream progress to the panel and poll for completion
+		context.scene.mesh_kit_settings.feedback_failures = ''
+		if not bpy.app.timers.is_registered(pack_progress):
+			bpy.app.timers.register(pack_progress, first_interval=0.1)
+		self.event_timer = context.window_manager.event_timer_add(0.1, window=context.window)
+		context.window_manager.modal_handler_add(self)
+		return {'RUNNING_MODAL'}
+	
+	def modal(self, context, event):
+		# Cancel early, the kernel stops at its next progress check and the points accepted so far are kept
+		if event.type == 'ESC' and event.value == 'PRESS':
+			pack_state['cancel'] = True
+			return {'RUNNING_MODAL'}
+		
+		# Build the mesh on the main thread once the worker has finished
+		if event.type == 'TIMER' and not pack_state['thread'].is_alive():
+			self.stop_timers(context)
+			# Report a failed run instead of building a mesh from a missing result
+			if pack_state['error'] is not None:
+				print('Mesh Kit Point Array error: ' + str(pack_state['error']))
+				self.report({'ERROR'}, f"Point packing failed: {pack_state['error']}")
+				self.restore_mode(context)
+				return {'CANCELLED'}
+			return self.finish(context, pack_state['result'])
+		
+		return {'PASS_THROUGH'}
+	
+	def cancel(self, context):
+		# Blender stopped the modal itself (for example on file load), so stop the worker and clean up the timers
+		pack_state['cancel'] = True
+		self.stop_timers(context)
+	
+	def stop_timers(self, context):
+		"""Remove the modal event timer and the progress timer, so the progress can't overwrite the final feedback values"""
+		context.window_manager.event_timer_remove(self.event_timer)
+		if bpy.app.timers.is_registered(pack_progress):
+			bpy.app.timers.unregister(pack_progress)
+
+def pack_progress():
+	"""Timer callback that copies the background pack progress into the feedback strings and redraws the sidebar"""
+	# Once the worker has finished the operator writes the final values
+	if not pack_state or pack_state['thread'] is None or not pack_state['thread'].is_alive():
+		return None
+	settings = bpy.context.scene.mesh_kit_settings
+	settings.feedback_elements = str(pack_state['count'])
+	settings.feedback_attempts = str(pack_state['attempts'])
+	settings.feedback_time = str(round(time.time() - pack_state['start'], 2))
+	for window in bpy.context.window_manager.windows:
+		for area in window.screen.areas:
+			if area.type == 'VIEW_3D':
+				area.tag_redraw()
+	return 0.1
 
 
 
@@ -436,36 +787,24 @@ class MeshKit_Import_Position_Data(bpy.types.Operator):
 		else:
 			object_mode = None
 		
-		# Create a new bmesh
-		bm = bmesh.new()
+		# Use the first three columns as positions, missing columns default to zero
+		values = data.astype(np.float64)
+		count = len(values)
+		positions = np.zeros((count, 3))
+		positions[:, :min(values.shape[1], 3)] = values[:, :3]
 		
-		# Set up attribute layers
-		# We don't need to check for an existing vertex layer because this is a fresh Bmesh
-		pf = bm.verts.layers.float.new('factor')
-		ps = bm.verts.layers.float.new('scale')
-		pr = bm.verts.layers.float_vector.new('rotation')
-		
-		# Cycle through rows
-		count = len(data)
-		for i, row in enumerate(data):
-			pointX = float(row[0]) if len(row) > 0 else 0.0
-			pointY = float(row[1]) if len(row) > 1 else 0.0
-			pointZ = float(row[2]) if len(row) > 2 else 0.0
-			v = bm.verts.new((float(pointX), float(pointY), float(pointZ)))
-			v[pf] = 0.0 if i == 0.0 else i / count
-			v[ps] = scale_max if not scale_random else uniform(scale_min, scale_max)
-			v[pr] = Vector([0.0, 0.0, 0.0]) if not rotation_rand else Vector([uniform(-math.pi, math.pi), uniform(-math.pi, math.pi), uniform(-math.pi, math.pi)])
-		
-		# Connect vertices
-		if bpy.context.scene.mesh_kit_settings.polyline:
-			bm.verts.ensure_lookup_table()
-			for i in range(len(bm.verts)-1):
-				bm.edges.new([bm.verts[i], bm.verts[i+1]])
+		# Point attributes
+		rng = np.random.default_rng(bpy.context.scene.mesh_kit_settings.seed)
+		factor = np.arange(count) / count
+		scale = np.full(count, scale_max) if not scale_random else rng.uniform(*sorted((scale_min, scale_max)), count)
+		rotation = np.zeros((count, 3)) if not rotation_rand else rng.uniform(-math.pi, math.pi, (count, 3))
 		
 		# Replace object with new mesh data
-		bm.to_mesh(obj.data)
-		bm.free()
-		obj.data.update() # This ensures the viewport updates
+		write_point_mesh(obj.data, positions, [
+			('factor', 'FLOAT', factor),
+			('scale', 'FLOAT', scale),
+			('rotation', 'FLOAT_VECTOR', rotation),
+		], polyline_settings_edges(bpy.context.scene.mesh_kit_settings, count))
 		
 		# Reset to original mode
 		if object_mode is not None:
@@ -581,6 +920,11 @@ class MeshKit_Import_Volume_Field(bpy.types.Operator):
 		pv = bm.verts.layers.float_vector.new('field_vector')
 		pf = bm.verts.layers.float.new('field_float')
 		
+		# Draw the random attributes in bulk
+		rng = np.random.default_rng(bpy.context.scene.mesh_kit_settings.seed)
+		scales = np.full(len(data), scale_max) if not scale_random else rng.uniform(*sorted((scale_min, scale_max)), len(data))
+		rotations = rng.uniform(-math.pi, math.pi, (len(data), 3)) if rotation_rand and is_float_data else None
+		
 		# Create geometry and assign field values
 		count = len(data) - 1
 		i = 0
@@ -590,11 +934,11 @@ class MeshKit_Import_Volume_Field(bpy.types.Operator):
 				for _x in range(grid_x):
 					v = bm.verts.new((_x * space + offset_x, _y * space + offset_y, _z * space + offset_z))
 					v[pf] = 0.0 if i == 0 else i / count
-					v[ps] = scale_max if not scale_random else uniform(scale_min, scale_max)
+					v[ps] = scales[i]
 					if is_float_data:
 						v[pv] = vec
 						v[pf] = data[i]
-						v[pr] = vec if not rotation_rand else Vector([uniform(-math.pi, math.pi), uniform(-math.pi, math.pi), uniform(-math.pi, math.pi)])
+						v[pr] = vec if not rotation_rand else Vector(rotations[i])
 					else:
 						vec = Vector(tuple(data[i])).xzy # Second step in swizzled channel order
 						v[pv] = vec
@@ -602,15 +946,15 @@ class MeshKit_Import_Volume_Field(bpy.types.Operator):
 						v[pr] = vec.to_track_quat('Z','Y').to_euler()
 					i += 1
 		
-		# Connect vertices
-		if bpy.context.scene.mesh_kit_settings.polyline:
-			bm.verts.ensure_lookup_table()
-			for i in range(len(bm.verts)-1):
-				bm.edges.new([bm.verts[i], bm.verts[i+1]])
-		
 		# Replace object with new mesh data
+		count = len(bm.verts)
 		bm.to_mesh(obj.data)
 		bm.free()
+		
+		# Connect vertices (the field is stored in the same swizzled order as the cubic grid, with Y and Z exchanged)
+		edges = polyline_settings_edges(bpy.context.scene.mesh_kit_settings, count, (grid_x, grid_z, grid_y))
+		if edges is not None:
+			add_edges(obj.data, edges)
 		obj.data.update() # This ensures the viewport updates
 		
 		# Store the grid settings to custom mesh properties
@@ -683,7 +1027,12 @@ class MESHKIT_PT_point_array(bpy.types.Panel):
 					layout.prop(context.scene.mesh_kit_settings, 'scale_maximum')
 				layout.prop(context.scene.mesh_kit_settings, 'scale_random')
 				layout.prop(context.scene.mesh_kit_settings, 'rotation_random')
+				if bpy.context.scene.mesh_kit_settings.scale_random or bpy.context.scene.mesh_kit_settings.rotation_random:
+					layout.prop(context.scene.mesh_kit_settings, 'seed')
 				layout.prop(context.scene.mesh_kit_settings, 'polyline')
+				if bpy.context.scene.mesh_kit_settings.polyline:
+					layout.prop(context.scene.mesh_kit_settings, 'polyline_closed')
+					layout.prop(context.scene.mesh_kit_settings, 'polyline_break')
 				layout.prop(context.scene.mesh_kit_settings, 'grid_ground')
 				
 				if bpy.context.view_layer.objects.active is not None and bpy.context.view_layer.objects.active.type == "MESH":
@@ -709,7 +1058,11 @@ class MESHKIT_PT_point_array(bpy.types.Panel):
 					layout.prop(context.scene.mesh_kit_settings, 'scale_maximum')
 				layout.prop(context.scene.mesh_kit_settings, 'scale_random')
 				layout.prop(context.scene.mesh_kit_settings, 'rotation_random')
+				if bpy.context.scene.mesh_kit_settings.scale_random or bpy.context.scene.mesh_kit_settings.rotation_random:
+					layout.prop(context.scene.mesh_kit_settings, 'seed')
 				layout.prop(context.scene.mesh_kit_settings, 'polyline')
+				if bpy.context.scene.mesh_kit_settings.polyline:
+					layout.prop(context.scene.mesh_kit_settings, 'polyline_closed')
 				layout.prop(context.scene.mesh_kit_settings, 'golden_fill')
 				
 				if bpy.context.view_layer.objects.active is not None and bpy.context.view_layer.objects.active.type == "MESH":
@@ -725,7 +1078,7 @@ class MESHKIT_PT_point_array(bpy.types.Panel):
 					layout.operator(MeshKit_Point_Golden.bl_idname, text=ui_button)
 			
 			# Poisson Disc UI
-			elif bpy.context.scene.mesh_kit_settings.array_type == "PACK":
+			elif bpy.context.scene.mesh_kit_settings.array_type == "PACK" or bpy.context.scene.mesh_kit_settings.array_type == "BRIDSON":
 				layout.prop(context.scene.mesh_kit_settings, 'area_shape')
 				col=layout.column()
 				col.prop(context.scene.mesh_kit_settings, 'area_size')
@@ -744,13 +1097,17 @@ class MESHKIT_PT_point_array(bpy.types.Panel):
 					layout.prop(context.scene.mesh_kit_settings, 'scale_maximum')
 				layout.prop(context.scene.mesh_kit_settings, 'scale_random')
 				layout.prop(context.scene.mesh_kit_settings, 'rotation_random')
+				layout.prop(context.scene.mesh_kit_settings, 'seed')
 				layout.prop(context.scene.mesh_kit_settings, 'polyline')
+				if bpy.context.scene.mesh_kit_settings.polyline:
+					layout.prop(context.scene.mesh_kit_settings, 'polyline_closed')
 				
 				# Limits
 				layout.label(text='Iteration Limits')
 				layout.prop(context.scene.mesh_kit_settings, 'max_elements')
-				layout.prop(context.scene.mesh_kit_settings, 'max_failures')
-				layout.prop(context.scene.mesh_kit_settings, 'max_attempts')
+				if bpy.context.scene.mesh_kit_settings.array_type == "PACK":
+					layout.prop(context.scene.mesh_kit_settings, 'max_failures')
+					layout.prop(context.scene.mesh_kit_settings, 'max_attempts')
 				
 				if bpy.context.view_layer.objects.active is not None and bpy.context.view_layer.objects.active.type == "MESH":
 					target_name = bpy.context.view_layer.objects.active.name
@@ -768,8 +1125,10 @@ class MESHKIT_PT_point_array(bpy.types.Panel):
 					ui_button = ''
 					ui_message = 'no mesh selected'
 				
-				# Display create button
-				if ui_button:
+				# Display create button, or the cancel hint while packing in the background
+				if pack_state.get('thread') is not None and pack_state['thread'].is_alive():
+					layout.label(text='Packing points, press Esc to stop')
+				elif ui_button:
 					layout.operator(MeshKit_Point_Pack.bl_idname, text=ui_button)
 			
 			# Position Data Import UI
@@ -809,7 +1168,11 @@ class MESHKIT_PT_point_array(bpy.types.Panel):
 						layout.prop(context.scene.mesh_kit_settings, 'scale_maximum')
 					layout.prop(context.scene.mesh_kit_settings, 'scale_random')
 					layout.prop(context.scene.mesh_kit_settings, 'rotation_random')
+					if bpy.context.scene.mesh_kit_settings.scale_random or bpy.context.scene.mesh_kit_settings.rotation_random:
+						layout.prop(context.scene.mesh_kit_settings, 'seed')
 					layout.prop(context.scene.mesh_kit_settings, 'polyline')
+					if bpy.context.scene.mesh_kit_settings.polyline:
+						layout.prop(context.scene.mesh_kit_settings, 'polyline_closed')
 					
 					# Target object
 					layout.prop(context.scene.mesh_kit_settings, 'data_target', expand=True)
@@ -857,7 +1220,12 @@ class MESHKIT_PT_point_array(bpy.types.Panel):
 						layout.prop(context.scene.mesh_kit_settings, 'scale_maximum')
 					layout.prop(context.scene.mesh_kit_settings, 'scale_random')
 					layout.prop(context.scene.mesh_kit_settings, 'rotation_random')
+					if bpy.context.scene.mesh_kit_settings.scale_random or bpy.context.scene.mesh_kit_settings.rotation_random:
+						layout.prop(context.scene.mesh_kit_settings, 'seed')
 					layout.prop(context.scene.mesh_kit_settings, 'polyline')
+					if bpy.context.scene.mesh_kit_settings.polyline:
+						layout.prop(context.scene.mesh_kit_settings, 'polyline_closed')
+						layout.prop(context.scene.mesh_kit_settings, 'polyline_break')
 					layout.prop(context.scene.mesh_kit_settings, 'field_center')
 					
 					# Target object
@@ -918,6 +1286,11 @@ def register():
 
 
 def unregister():
+	# Stop any background pack, the worker thread exits at its next progress check
+	if pack_state:
+		pack_state['cancel'] = True
+	if bpy.app.timers.is_registered(pack_progress):
+		bpy.app.timers.unregister(pack_progress)
 	for cls in reversed(classes):
 		bpy.utils.unregister_class(cls)
 
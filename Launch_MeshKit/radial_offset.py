@@ -1,8 +1,74 @@
 import bpy
 from bpy.app.handlers import persistent
 import mathutils
+import numpy as np
+import time
+from .mesh_arrays import read_vertices, write_vertices, process_buffers
 #import bmesh # Only used to get active vertex, the rest of the operations act on the mesh data directly
 
+###########################################################################
+# Array helpers
+
+def falloff_weights(distance, radius, falloff, power=2.0):
+	"""Return the offset strength for each distance from the pivot, fading from 1.0 at the pivot to 0.0 at the falloff radius"""
+	t = np.clip(np.asarray(distance, dtype=np.float64) / max(radius, 1e-9), 0.0, 1.0)
+	if falloff == 'SMOOTH':
+		t = t * t * (3.0 - 2.0 * t)
+	elif falloff == 'SMOOTHER':
+		t = t * t * t * (t * (6.0 * t - 15.0) + 10.0)
+	elif falloff == 'POWER':
+		t = t ** power
+	return 1.0 - t
+
+def vertex_group_weights(obj, name, indices):
+	"""Return the vertex group weight of each listed vertex index (0.0 where unassigned, or everywhere if the object lacks the group)
+	Vertex groups have no bulk accessor, so this is the one per-vertex loop left in the offset"""
+	group = obj.vertex_groups.get(name)
+	if group is None:
+		return np.zeros(len(indices), dtype=np.float64)
+	weights = np.zeros(len(indices), dtype=np.float64)
+	vertices = obj.data.vertices
+	for i, index in enumerate(indices.tolist()):
+		for element in vertices[index].groups:
+			if element.group == group.index:
+				weights[i] = element.weight
+				break
+	return weights
+
+def radial_offset_array(co, point, offset, falloff='NONE', radius=1.0, power=2.0, weights=None):
+	"""Move each row of co away from point by offset along its normalised radial direction
+	Axes with a zero offset are ignored when building the direction, and rows that sit exactly on the point are left in place
+	The offset can be scaled by a falloff over the radial distance and by per-row weights"""
+	co = np.asarray(co, dtype=np.float64)
+	offset = np.asarray(offset, dtype=np.float64)
+	radial = (co - np.asarray(point, dtype=np.float64)) * (offset != 0.0)
+	length = np.sqrt(np.einsum('ij,ij->i', radial, radial))
+	scale = np.divide(1.0, length, out=np.zeros_like(length), where=length > 0.0)
+	if falloff != 'NONE':
+		scale *= falloff_weights(length, radius, falloff, power)
+	if weights is not None:
+		scale *= weights
+	return co + radial * scale[:, None] * offset
+
+def world_to_local(obj, point):
+	"""Convert a world space point into the local space of obj
+	The safe inverse keeps objects flattened with a zero scale working instead of raising on a singular matrix"""
+	matrix = np.array(obj.matrix_world.inverted_safe(), dtype=np.float64)
+	return (matrix @ np.append(np.asarray(point, dtype=np.float64), 1.0))[:3]
+
+def world_bounds_centre(objects, buffers):
+	"""Return the world space centre of the bounding box around the selected vertices of every object"""
+	minimum = np.full(3, np.inf)
+	maximum = np.full(3, -np.inf)
+	for obj, (co, sel) in zip(objects, buffers):
+		if not sel.any():
+			continue
+		matrix = np.array(obj.matrix_world, dtype=np.float64)
+		world = co[sel].astype(np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+		minimum = np.minimum(minimum, world.min(axis=0))
+		maximum = np.maximum(maximum, world.max(axis=0))
+	return (minimum + maximum) * 0.5
+
 ###########################################################################
 # Main class
 
@@ -17,54 +83,89 @@ class MeshKit_Radial_Offset(bpy.types.Operator):
 			return {'CANCELLED'}
 		
 		# Set up local variables
-		offset = context.scene.mesh_kit_settings.offset_distance
-		channels = mathutils.Vector((0.0 if offset[0] == 0.0 else 1.0, 0.0 if offset[1] == 0.0 else 1.0, 0.0 if offset[2] == 0.0 else 1.0))
+		settings = context.scene.mesh_kit_settings
+		offset = settings.offset_distance
+		timer = time.perf_counter()
 		
-		# Begin code modified from Scriblab and Photox source on BlenderArtist https://blenderartists.org/t/move-selected-vertices-with-python-script/1303114
+		# Switch to object mode
 		mode = context.active_object.mode
 		bpy.ops.object.mode_set(mode='OBJECT')
-		selectedVerts = [v for v in context.active_object.data.vertices if v.select]
+		
+		# Collect target objects, processing meshes shared between objects only once
+		active = context.active_object
+		objects = []
+		for obj in [active] + (list(context.selected_objects) if settings.offset_selected else []):
+			if obj.type == 'MESH' and obj.data not in [target.data for target in objects]:
+				objects.append(obj)
+		
+		# Read coordinates and selection in bulk
+		buffers = [read_vertices(obj.data) for obj in objects]
+		
+		# Nothing to do without a selection
+		if not any(sel.any() for co, sel in buffers):
+			bpy.ops.object.mode_set(mode=mode)
+			return {'CANCELLED'}
 		
 		# Get specified offset starting point position
-		if context.scene.mesh_kit_settings.offset_position == 'BOUNDING':
-			minCo = selectedVerts[0].co.copy()
-			maxCo = selectedVerts[0].co.copy()
-			for vert in selectedVerts:
-				minCo[0] = min(minCo[0], vert.co[0])
-				minCo[1] = min(minCo[1], vert.co[1])
-				minCo[2] = min(minCo[2], vert.co[2])
-				maxCo[0] = max(maxCo[0], vert.co[0])
-				maxCo[1] = max(maxCo[1], vert.co[1])
-				maxCo[2] = max(maxCo[2], vert.co[2])
-			point = ((maxCo - minCo) * 0.5) + minCo
-#		elif context.scene.mesh_kit_settings.offset_position == 'ACTIVE':
-#			bpy.ops.object.mode_set(mode='EDIT')
-#			temp = bmesh.from_edit_mesh(bpy.context.active_object.data)
-#			point = temp.select_history.active.co
-#			bpy.ops.object.mode_set(mode='OBJECT')
-		elif context.scene.mesh_kit_settings.offset_position == 'CUSTOM':
-			point = context.scene.mesh_kit_settings.offset_position_custom
-		elif context.scene.mesh_kit_settings.offset_position == 'CURSOR':
-			point = context.scene.cursor.location
-		else: # OBJECT
-			point = mathutils.Vector((0.0, 0.0, 0.0))
+		if settings.offset_selected:
+			# Resolve a single world space pivot shared by every object, then convert it into each local space once
+			if settings.offset_position == 'BOUNDING':
+				pivot = world_bounds_centre(objects, buffers)
+			elif settings.offset_position == 'CUSTOM':
+				pivot = active.matrix_world @ mathutils.Vector(settings.offset_position_custom)
+			elif settings.offset_position == 'CURSOR':
+				pivot = context.scene.cursor.location
+			else: # OBJECT
+				pivot = active.matrix_world.translation
+			points = [world_to_local(obj, pivot) for obj in objects]
+		else:
+			if settings.offset_position == 'BOUNDING':
+				co, sel = buffers[0]
+				selected = co[sel]
+				point = (selected.min(axis=0) + selected.max(axis=0)) * 0.5
+#			elif settings.offset_position == 'ACTIVE':
+#				bpy.ops.object.mode_set(mode='EDIT')
+#				temp = bmesh.from_edit_mesh(bpy.context.active_object.data)
+#				point = temp.select_history.active.co
+#				bpy.ops.object.mode_set(mode='OBJECT')
+			elif settings.offset_position == 'CUSTOM':
+				point = settings.offset_position_custom
+			elif settings.offset_position == 'CURSOR':
+				point = context.scene.cursor.location
+			else: # OBJECT
+				point = (0.0, 0.0, 0.0)
+			points = [point]
 		
-		# Process vertices
-		for vert in selectedVerts:
-			new_location = vert.co
-			radial_vector = ((vert.co - point) * channels).normalized()
-			
-			if offset[0] != 0.0:
-				new_location[0] = new_location[0] + (radial_vector[0] * offset[0])
-			if offset[1] != 0.0:
-				new_location[1] = new_location[1] + (radial_vector[1] * offset[1])
-			if offset[2] != 0.0:
-				new_location[2] = new_location[2] + (radial_vector[2] * offset[2])
-			vert.co = new_location
+		# Optional vertex group weights for the selected vertices
+		weights = [None] * len(objects)
+		if settings.offset_vertex_group:
+			weights = [vertex_group_weights(obj, settings.offset_vertex_group, np.flatnonzero(sel)) for obj, (co, sel) in zip(objects, buffers)]
+		
+		# Resolve the settings into plain values on the main thread, the worker threads must not touch Blender data
+		offset = np.array(offset, dtype=np.float64)
+		falloff = settings.offset_falloff
+		radius = float(settings.offset_falloff_radius)
+		power = float(settings.offset_falloff_power)
+		points = [np.array(point, dtype=np.float64) for point in points]
+		
+		# Process all selected vertices of each object in a single vectorised pass
+		def offset_job(job):
+			(co, sel), point, weight = job
+			co[sel] = radial_offset_array(co[sel], point, offset, falloff, radius, power, weight)
+			return co
+		results = process_buffers(offset_job, list(zip(buffers, points, weights)))
+		
+		# Write everything back within this single operator call, so the whole batch is one undo step
+		for obj, co in zip(objects, results):
+			write_vertices(obj.data, co)
 		
 		# Reset object mode to original
 		bpy.ops.object.mode_set(mode=mode)
 		
+		if settings.offset_selected:
+			count = sum(int(sel.sum()) for co, sel in buffers)
+			self.report({'INFO'}, f"Offset {count} vertices across {len(objects)} objects in {time.perf_counter() - timer:.3f}s")
+		
 		# Done
 		return {'FINISHED'}
 
@@ -105,6 +206,15 @@ class MESHKIT_PT_radial_offset(bpy.types.Panel):
 			col=layout.column()
 			col.prop(context.scene.mesh_kit_settings, 'offset_distance')
 			
+			layout.prop(context.scene.mesh_kit_settings, 'offset_falloff')
+			if context.scene.mesh_kit_settings.offset_falloff != "NONE":
+				layout.prop(context.scene.mesh_kit_settings, 'offset_falloff_radius')
+				if context.scene.mesh_kit_settings.offset_falloff == "POWER":
+					layout.prop(context.scene.mesh_kit_settings, 'offset_falloff_power')
+			layout.prop(context.scene.mesh_kit_settings, 'offset_selected')
+			if context.view_layer.objects.active and context.view_layer.objects.active.type == "MESH":
+				layout.prop_search(context.scene.mesh_kit_settings, 'offset_vertex_group', context.view_layer.objects.active, 'vertex_groups')
+			
 			# if context.view_layer.objects.active.data.vertices:
 			if context.view_layer.objects.active and context.view_layer.objects.active.type == "MESH":
 				layout.operator(MeshKit_Radial_Offset.bl_idname)
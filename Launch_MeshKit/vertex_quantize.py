@@ -1,4 +1,161 @@
 import bpy
+import bmesh
+import numpy as np
+import time
+from .mesh_arrays import read_vertices, write_vertices, process_buffers
+
+###########################################################################
+# Array helpers
+
+def read_uvs(uv_layer):
+	"""Return (n, 2) float32 UV coordinates and a boolean selection mask for every loop in the UV layer"""
+	count = len(uv_layer.data)
+	uv = np.empty(count * 2, dtype=np.float32)
+	sel = np.empty(count, dtype=bool)
+	uv_layer.data.foreach_get('uv', uv)
+	uv_layer.data.foreach_get('select', sel)
+	return uv.reshape(count, 2), sel
+
+def write_uvs(mesh, uv_layer, uv):
+	"""Write (n, 2) UV coordinates back to the UV layer in a single call"""
+	uv_layer.data.foreach_set('uv', np.ascontiguousarray(uv, dtype=np.float32).ravel())
+	mesh.update()
+
+def read_edit_vertices(obj):
+	"""Return (n, 3) float32 coordinates, the selection mask, and the selected vertex indices of an object in edit mode
+	The edit mesh is flushed into the mesh data first, so it can be read with foreach_get instead of a per-vertex BMesh loop"""
+	obj.update_from_editmode()
+	co, sel = read_vertices(obj.data)
+	return co, sel, np.flatnonzero(sel)
+
+def write_edit_vertices(mesh, indices, co, original):
+	"""Write coordinates back to the live edit mesh, only touching the selected vertices that moved"""
+	changed = indices[np.any(co[indices] != original[indices], axis=1)]
+	verts = bmesh.from_edit_mesh(mesh).verts
+	verts.ensure_lookup_table()
+	for index, position in zip(changed.tolist(), co[changed].tolist()):
+		verts[index].co = position
+	bmesh.update_edit_mesh(mesh, destructive=False)
+
+def read_edit_uvs(obj):
+	"""Return (n, 2) float32 UV coordinates, the selection mask, and the selected loop indices of an object in edit mode
+	The edit mesh is flushed into the mesh data first, so it can be read with foreach_get instead of a per-loop BMesh loop"""
+	obj.update_from_editmode()
+	uv, sel = read_uvs(obj.data.uv_layers.active)
+	return uv, sel, np.flatnonzero(sel)
+
+def write_edit_uvs(mesh, indices, uv, original):
+	"""Write UV coordinates back to the live edit mesh, only touching the selected loops that moved
+	Mesh loops follow the BMesh face order, so each changed loop is found from its face and corner"""
+	changed = indices[np.any(uv[indices] != original[indices], axis=1)]
+	starts = np.empty(len(mesh.polygons), dtype=np.int32)
+	mesh.polygons.foreach_get('loop_start', starts)
+	faces = np.searchsorted(starts, changed, 'right') - 1
+	bm = bmesh.from_edit_mesh(mesh)
+	layer = bm.loops.layers.uv.active
+	bm.faces.ensure_lookup_table()
+	for face, corner, position in zip(faces.tolist(), (changed - starts[faces]).tolist(), uv[changed].tolist()):
+		bm.faces[face].loops[corner][layer].uv = position
+	bmesh.update_edit_mesh(mesh, destructive=False)
+
+def quantize_array(values, steps, divisions=False):
+	"""Round each column of values to the matching step size, columns with a step of zero are left unchanged
+	When divisions is enabled the steps are treated as the number of divisions per unit instead of increments"""
+	values = np.asarray(values, dtype=np.float64)
+	steps = np.asarray(steps, dtype=np.float64)
+	active = steps > 0.0
+	safe = np.where(active, steps, 1.0)
+	if divisions:
+		return np.where(active, np.round(values * safe) / safe, values)
+	return np.where(active, np.round(values / safe) * safe, values)
+
+def quantize_cells(values, steps):
+	"""Return the integer grid cell of each row as used by quantize_array
+	Columns with a step of zero use the float32 bit pattern instead, so only exactly matching values share a cell"""
+	# Adding zero turns -0.0 into 0.0, so both signed zeros share one bit pattern
+	values = np.asarray(values, dtype=np.float32) + np.float32(0.0)
+	steps = np.asarray(steps, dtype=np.float64)
+	active = steps > 0.0
+	safe = np.where(active, steps, 1.0)
+	cells = np.round(values.astype(np.float64) / safe).astype(np.int64)
+	return np.where(active, cells, values.view(np.int32).astype(np.int64))
+
+def coincident_targets(cells, indices):
+	"""Group rows that share a grid cell, returning the duplicate indices and the first index of their group to merge into"""
+	if len(indices) < 2:
+		return indices[:0], indices[:0]
+	_, first, inverse = np.unique(cells, axis=0, return_index=True, return_inverse=True)
+	targets = indices[first[inverse.ravel()]]
+	duplicates = targets != indices
+	return indices[duplicates], targets[duplicates]
+
+def weld_vertices(mesh, duplicates, targets):
+	"""Merge each duplicate vertex index into its target, using the live edit mesh when the mesh is in edit mode"""
+	if mesh.is_editmode:
+		bm = bmesh.from_edit_mesh(mesh)
+	else:
+		bm = bmesh.new()
+		bm.from_mesh(mesh)
+	bm.verts.ensure_lookup_table()
+	verts = bm.verts
+	bmesh.ops.weld_verts(bm, targetmap={verts[d]: verts[t] for d, t in zip(duplicates.tolist(), targets.tolist())})
+	if mesh.is_editmode:
+		bmesh.update_edit_mesh(mesh)
+	else:
+		bm.to_mesh(mesh)
+		bm.free()
+		mesh.update()
+
+def quantize_targets(context):
+	"""Return the mesh objects to process, either the active object alone or every selected mesh object
+	Only the first object using each mesh is returned, so meshes shared between several objects are only included once"""
+	objects = [context.active_object]
+	if context.scene.mesh_kit_settings.quantize_selected:
+		objects += [obj for obj in context.selected_objects if obj != context.active_object]
+	targets = []
+	for obj in objects:
+		if obj is not None and obj.type == 'MESH' and obj.data not in [target.data for target in targets]:
+			targets.append(obj)
+	return targets
+
+def quantize_vertices(context, steps, merge=False):
+	"""Snap the selected vertices of every target mesh to the (X, Y, Z) steps, optionally merging vertices that land in the same cell
+	Returns a throughput report for the operator"""
+	# Read coordinates and selection in bulk on the main thread
+	# Meshes in edit mode are flushed from the live edit mesh, avoiding an object mode round trip that would rebuild it twice
+	timer = time.perf_counter()
+	objects = quantize_targets(context)
+	meshes = [obj.data for obj in objects]
+	buffers = [read_edit_vertices(obj) if obj.data.is_editmode else read_vertices(obj.data) + (None,) for obj in objects]
+	
+	# Snap all selected vertices of each mesh in a single vectorised pass
+	# When merging, the cell coordinates from the snap are hashed to find coincident vertices without a second distance search
+	def snap(buffer):
+		co, sel, indices = buffer
+		co = co.copy()
+		co[sel] = quantize_array(co[sel], steps)
+		if merge:
+			indices = np.flatnonzero(sel)
+			return (co,) + coincident_targets(quantize_cells(co[sel], steps), indices)
+		return co, None, None
+	results = process_buffers(snap, buffers)
+	
+	# Write results back on the main thread
+	merged = 0
+	for mesh, (original, sel, indices), (co, duplicates, targets) in zip(meshes, buffers, results):
+		if indices is None:
+			write_vertices(mesh, co)
+		else:
+			write_edit_vertices(mesh, indices, co, original)
+		if merge and len(duplicates) > 0:
+			weld_vertices(mesh, duplicates, targets)
+			merged += len(duplicates)
+	
+	# Report throughput
+	count = sum(int(sel.sum()) for co, sel, indices in buffers)
+	elapsed = time.perf_counter() - timer
+	merge_report = f", merged {merged} coincident vertices" if merge else ""
+	return f"Quantized {count} vertices across {len(meshes)} meshes{merge_report} in {elapsed:.3f}s ({count / max(elapsed, 1e-9):,.0f} vertices/s)"
 
 ###########################################################################
 # Main class
@@ -22,31 +179,120 @@ class MeshKit_Vertex_Quantize(bpy.types.Operator):
 			quantY = context.scene.mesh_kit_settings.vert_xyz[1] # Y quantization
 			quantZ = context.scene.mesh_kit_settings.vert_xyz[2] # Z quantization
 		
-		# Get current mode and save it
-		mode = context.active_object.mode
+		# Snap (and optionally merge) the selected vertices of every target mesh
+		self.report({'INFO'}, quantize_vertices(context, (quantX, quantY, quantZ), context.scene.mesh_kit_settings.vert_merge))
+		
+		# Done
+		return {'FINISHED'}
+
+class MeshKit_Vertex_Quantize_Modal(bpy.types.Operator):
+	bl_idname = "ops.meshkit_vertex_quantize_modal"
+	bl_label = "Interactive Quantize"
+	bl_description = "Interactively scrub the quantization step with mouse drag or wheel (Ctrl snaps to powers of two, click or Enter to confirm, Esc to cancel), merging vertices on confirm if enabled"
+	bl_options = {'REGISTER', 'UNDO', 'BLOCKING'}
+	
+	steps: bpy.props.FloatVectorProperty(
+		name="Steps",
+		description="Quantization step for each axis, uses the panel settings when not set",
+		size=3,
+		min=0.0)
+	
+	def execute(self, context):
+		if not (context.active_object and context.active_object.type == 'MESH' and context.active_object.data.vertices):
+			print("Error in Mesh Kit Vertex Quantize operation (vertex data not available)")
+			return {'CANCELLED'}
+		
+		# Scripted calls without steps fall back to the panel settings
+		settings = context.scene.mesh_kit_settings
+		if not self.properties.is_property_set("steps"):
+			self.steps = (settings.vert_uniform,) * 3 if settings.vert_dimensions == 'True' else tuple(settings.vert_xyz)
+		
+		# Apply the final steps through the same path as the panel operator, including the merge option
+		self.report({'INFO'}, quantize_vertices(context, tuple(self.steps), settings.vert_merge))
+		return {'FINISHED'}
+	
+	def invoke(self, context, event):
+		if not (context.active_object and context.active_object.type == 'MESH' and context.active_object.data.vertices):
+			print("Error in Mesh Kit Vertex Quantize operation (vertex data not available)")
+			return {'CANCELLED'}
+		
+		# Set up starting steps
+		settings = context.scene.mesh_kit_settings
+		self.uniform = settings.vert_dimensions == 'True'
+		if self.uniform:
+			self.initial = np.full(3, settings.vert_uniform, dtype=np.float64)
+		else:
+			self.initial = np.array(settings.vert_xyz, dtype=np.float64)
+		self.preview = self.initial.copy()
 		
-		# Switch to object mode
+		# Switch to object mode once for the whole interaction so every update is a single foreach_set
+		self.mode = context.active_object.mode
 		bpy.ops.object.mode_set(mode='OBJECT')
 		
-		# Get selected vertices
-		selectedVerts = [v for v in context.active_object.data.vertices if v.select]
+		# Snapshot the original coordinates, every update re-snaps from these
+		self.snapshots = [(obj.data,) + read_vertices(obj.data) for obj in quantize_targets(context)]
 		
-		# Process vertices
-		for vert in selectedVerts:
-			new_location = vert.co
-			if quantX > 0.0:
-				new_location[0] = round(new_location[0] / quantX) * quantX
-			if quantY > 0.0:
-				new_location[1] = round(new_location[1] / quantY) * quantY
-			if quantZ > 0.0:
-				new_location[2] = round(new_location[2] / quantZ) * quantZ
-			vert.co = new_location
+		# Mouse tracking
+		self.start_x = event.mouse_x
+		self.drag = 0.0
+		self.wheel = 0.0
+		
+		self.update_steps(context, event)
+		context.window_manager.modal_handler_add(self)
+		return {'RUNNING_MODAL'}
+	
+	def modal(self, context, event):
+		if event.type == 'MOUSEMOVE':
+			self.drag = (event.mouse_x - self.start_x) / 200.0
+			self.update_steps(context, event)
+		elif event.type == 'WHEELUPMOUSE':
+			self.wheel += 1.0
+			self.update_steps(context, event)
+		elif event.type == 'WHEELDOWNMOUSE':
+			self.wheel -= 1.0
+			self.update_steps(context, event)
+		elif event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER'} and event.value == 'PRESS':
+			# Store the final steps in the panel settings
+			settings = context.scene.mesh_kit_settings
+			if self.uniform:
+				settings.vert_uniform = self.preview[0]
+			else:
+				settings.vert_xyz = tuple(self.preview)
+			# Restore the original coordinates and apply the final steps (and merge) through execute, so Adjust Last Operation can repeat it
+			for mesh, co, sel in self.snapshots:
+				write_vertices(mesh, co)
+			self.finish(context)
+			self.steps = tuple(self.preview)
+			return self.execute(context)
+		elif event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS':
+			# Restore the original coordinates
+			for mesh, co, sel in self.snapshots:
+				write_vertices(mesh, co)
+			self.finish(context)
+			return {'CANCELLED'}
+		return {'RUNNING_MODAL'}
+	
+	def update_steps(self, context, event):
+		# Drag and wheel scale the step exponentially, holding Ctrl snaps to whole powers of two
+		exponent = self.drag + self.wheel
+		if event.ctrl:
+			exponent = round(exponent)
+		self.preview = self.initial * (2.0 ** exponent)
 		
-		# Reset mode to original
-		bpy.ops.object.mode_set(mode=mode)
+		# Re-snap every mesh from its snapshot in one vectorised pass
+		for mesh, co, sel in self.snapshots:
+			snapped = co.copy()
+			snapped[sel] = quantize_array(co[sel], self.preview)
+			write_vertices(mesh, snapped)
 		
-		# Done
-		return {'FINISHED'}
+		if self.uniform:
+			context.area.header_text_set(f"Quantize step: {self.preview[0]:.4f}")
+		else:
+			context.area.header_text_set(f"Quantize steps: X {self.preview[0]:.4f}  Y {self.preview[1]:.4f}  Z {self.preview[2]:.4f}")
+	
+	def finish(self, context):
+		context.area.header_text_set(None)
+		bpy.ops.object.mode_set(mode=self.mode)
 
 class MeshKit_UV_Quantize(bpy.types.Operator):
 	bl_idname = "ops.meshkit_uv_quantize"
@@ -59,56 +305,48 @@ class MeshKit_UV_Quantize(bpy.types.Operator):
 			print("Error in Mesh Kit UV Quantize operation (UV data not available)")
 			return {'FINISHED'}
 		
-		# Set up local variables
-		if context.scene.mesh_kit_settings.uv_type == 'DIV':
-			if context.scene.mesh_kit_settings.uv_dimensions == 'True':
-				quantX = quantY = float(context.scene.mesh_kit_settings.uv_div_uniform)
+		# Set up local variables once, outside of the processing
+		settings = context.scene.mesh_kit_settings
+		divisions = settings.uv_type == 'DIV'
+		if divisions:
+			if settings.uv_dimensions == 'True':
+				quantX = quantY = float(settings.uv_div_uniform)
 			else:
-				quantX = float(context.scene.mesh_kit_settings.uv_div[0]) # X quantization
-				quantY = float(context.scene.mesh_kit_settings.uv_div[1]) # Y quantization
+				quantX = float(settings.uv_div[0]) # X quantization
+				quantY = float(settings.uv_div[1]) # Y quantization
 		else:
-			if context.scene.mesh_kit_settings.uv_dimensions == 'True':
-				quantX = quantY = float(context.scene.mesh_kit_settings.uv_val_uniform)
+			if settings.uv_dimensions == 'True':
+				quantX = quantY = float(settings.uv_val_uniform)
 			else:
-				quantX = context.scene.mesh_kit_settings.uv_val[0] # X quantization
-				quantY = context.scene.mesh_kit_settings.uv_val[1] # Y quantization
+				quantX = settings.uv_val[0] # X quantization
+				quantY = settings.uv_val[1] # Y quantization
 		
-		# Get current mode and save it
-		mode = context.active_object.mode
+		# Read every loop corner in bulk on the main thread, skipping meshes without UV maps
+		# Meshes in edit mode are flushed from the live edit mesh, avoiding an object mode round trip that would rebuild it twice
+		timer = time.perf_counter()
+		objects = [obj for obj in quantize_targets(context) if obj.data.uv_layers.active]
+		meshes = [obj.data for obj in objects]
+		buffers = [read_edit_uvs(obj) if obj.data.is_editmode else read_uvs(obj.data.uv_layers.active) + (None,) for obj in objects]
 		
-		# Switch to object mode
-		bpy.ops.object.mode_set(mode='OBJECT')
+		# Snap the selected corners of each mesh in a single vectorised pass
+		def snap(buffer):
+			uv, sel, indices = buffer
+			uv = uv.copy()
+			uv[sel] = quantize_array(uv[sel], (quantX, quantY), divisions)
+			return uv
+		results = process_buffers(snap, buffers)
 		
-		# Get object and active UV layer
-		obj = context.active_object.data
-		uv_layer = obj.uv_layers.active.data
+		# Write results back on the main thread
+		for mesh, (original, sel, indices), uv in zip(meshes, buffers, results):
+			if indices is None:
+				write_uvs(mesh, mesh.uv_layers.active, uv)
+			else:
+				write_edit_uvs(mesh, indices, uv, original)
 		
-		# Iterate over every polygon
-		for poly in obj.polygons:
-			
-			# Iterate over every loop
-			for loop_index in poly.loop_indices:
-				
-				# If selected
-				if uv_layer[loop_index].select:
-					uv = uv_layer[loop_index].uv
-					# If the quantization is defined in divisions
-					if context.scene.mesh_kit_settings.uv_type == 'DIV':
-						# Only process if a value greater than zero is provided
-						if quantX > 0.0:
-							uv.x = round(uv.x * quantX) / quantX
-						if quantY > 0.0:
-							uv.y = round(uv.y * quantY) / quantY
-					# If the quantization is defined in units
-					else:
-						# Only process if a value greater than zero is provided
-						if quantX > 0.0:
-							uv.x = round(uv.x / quantX) * quantX
-						if quantY > 0.0:
-							uv.y = round(uv.y / quantY) * quantY
-		
-		# Reset mode to original
-		bpy.ops.object.mode_set(mode=mode)
+		# Report throughput
+		count = sum(int(sel.sum()) for uv, sel, indices in buffers)
+		elapsed = time.perf_counter() - timer
+		self.report({'INFO'}, f"Quantized {count} UV points across {len(meshes)} meshes in {elapsed:.3f}s ({count / max(elapsed, 1e-9):,.0f} points/s)")
 		
 		# Done
 		return {'FINISHED'}
@@ -152,8 +390,13 @@ class MESHKIT_PT_vertex_quantize(bpy.types.Panel):
 				row = col.row(align=True)
 				row.prop(context.scene.mesh_kit_settings, 'vert_xyz', text='')
 			
-			# Display button
-			layout.operator(MeshKit_Vertex_Quantize.bl_idname)
+			layout.prop(context.scene.mesh_kit_settings, 'vert_merge')
+			layout.prop(context.scene.mesh_kit_settings, 'quantize_selected')
+			
+			# Display buttons
+			row = layout.row(align=True)
+			row.operator(MeshKit_Vertex_Quantize.bl_idname)
+			row.operator(MeshKit_Vertex_Quantize_Modal.bl_idname, text='', icon='MOUSE_MOVE')
 		except Exception as exc:
 			print(str(exc) + " | Error in Mesh Kit Vertex Quantize panel")
 
@@ -202,6 +445,8 @@ class MESHKIT_PT_uv_quantize(bpy.types.Panel):
 				else:
 					row.prop(context.scene.mesh_kit_settings, 'uv_val', text='')
 			
+			layout.prop(context.scene.mesh_kit_settings, 'quantize_selected')
+			
 			# Display button
 			layout.operator(MeshKit_UV_Quantize.bl_idname)
 		except Exception as exc: